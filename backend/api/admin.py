@@ -1,21 +1,21 @@
 # backend/api/admin.py
 """Admin endpoints for manual data updates and monitoring."""
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import FileResponse
-from datetime import datetime
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 import os
 import logging
+import threading
 from typing import Optional
 from pathlib import Path
 
-from backend.scraper.updater import update_rankings, update_player_bio
-from backend.scraper.tournament_scraper import scrape_tournaments
-from backend.scraper.schemas import TOURNAMENTS_SCHEMA
-from backend.scraper.config import VALID_TOURNAMENT_TYPES
+from backend.scraper.config import RankingType, TournamentType
 from backend.storage.s3_data_store import (
-    load_tournaments, save_tournaments, upsert_data, get_data_summary
+    upsert_tournaments, scan_tournaments, get_data_summary
 )
+from backend.api.cache import invalidate
 
 import polars as pl
 
@@ -26,9 +26,17 @@ logger = logging.getLogger(__name__)
 # Simple password auth from environment
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "changeme123")
 
-# In-memory job tracking (use Redis/DB for production)
-active_jobs = {}
-completed_jobs = []
+# In-memory job tracking; the container runs a single worker process
+MAX_COMPLETED_JOBS = 100
+active_jobs: dict[str, dict] = {}
+# job_id -> record, oldest first; doubles as the per-job lookup index
+completed_jobs: dict[str, dict] = {}
+_jobs_lock = threading.Lock()
+
+# Update jobs run one at a time on a dedicated thread, off the server's request
+# threadpool; each job drives its own Chromium so running them in parallel
+# would mostly contend for memory
+_job_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="admin-job")
 
 
 def verify_password(password: str | None) -> None:
@@ -37,6 +45,47 @@ def verify_password(password: str | None) -> None:
         raise HTTPException(status_code=401, detail="Invalid admin password")
 
 
+def _queue_job(job_id: str, **info) -> None:
+    """Register a job waiting for the job executor."""
+    with _jobs_lock:
+        active_jobs[job_id] = {
+            "status": "queued",
+            **info,
+            "started": datetime.now(timezone.utc).isoformat()
+        }
+
+
+def _start_job(job_id: str) -> None:
+    """Mark a queued job as running."""
+    with _jobs_lock:
+        job = active_jobs.setdefault(job_id, {})
+        job["status"] = "running"
+        job["started"] = datetime.now(timezone.utc).isoformat()
+
+
+def _complete_job(job_id: str, record: dict | None = None) -> None:
+    """Remove a job from the active set, recording its result if given."""
+    with _jobs_lock:
+        active_jobs.pop(job_id, None)
+        if record is not None:
+            completed_jobs[job_id] = {
+                "job_id": job_id,
+                "status": "completed",
+                **record,
+                "completed": datetime.now(timezone.utc).isoformat()
+            }
+            if len(completed_jobs) > MAX_COMPLETED_JOBS:
+                del completed_jobs[next(iter(completed_jobs))]
+
+
+def _fail_job(job_id: str, error: Exception) -> None:
+    """Mark an active job as failed."""
+    with _jobs_lock:
+        job = active_jobs.setdefault(job_id, {})
+        job["status"] = "failed"
+        job["error"] = str(error)
+
+
 @router.get("/dashboard")
 def serve_admin_dashboard():
     """Serve the admin dashboard HTML page."""
@@ -78,8 +127,7 @@ def get_summary(password: str = Query(...)):
 
 @router.post("/update-rankings")
 def manual_update_rankings(
-    background_tasks: BackgroundTasks,
-    ranking_type: str = Query("singles", pattern="^(singles|doubles)$"),
+    ranking_type: RankingType = Query("singles"),
     max_weeks: int = Query(10, ge=1, le=500),
     password: str = Query(...)
 ):
@@ -95,36 +143,35 @@ def manual_update_rankings(
 
     job_id = f"rankings_{ranking_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+    _queue_job(
+        job_id,
+        type="rankings",
+        ranking_type=ranking_type,
+        max_weeks=max_weeks
+    )
+
     def run_update():
+        # Scraper modules pull in Playwright; only load them when a job runs
+        from backend.scraper.updater import update_rankings
+
         try:
-            active_jobs[job_id] = {
-                "status": "running",
-                "type": "rankings",
-                "ranking_type": ranking_type,
-                "max_weeks": max_weeks,
-                "started": datetime.now().isoformat()
-            }
+            _start_job(job_id)
 
             count = update_rankings(ranking_type, max_weeks)
+            invalidate(f"rankings:{ranking_type}", "players")
 
-            completed_jobs.append({
-                "job_id": job_id,
-                "status": "completed",
+            _complete_job(job_id, {
                 "type": "rankings",
                 "ranking_type": ranking_type,
-                "weeks_scraped": count,
-                "completed": datetime.now().isoformat()
+                "weeks_scraped": count
             })
 
-            del active_jobs[job_id]
-
         except Exception as e:
             logger.error(f"Rankings update failed: {e}")
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["error"] = str(e)
+            _fail_job(job_id, e)
 
-    # Run in background
-    background_tasks.add_task(run_update)
+    # Run on the job executor
+    _job_executor.submit(run_update)
 
     return {
         "job_id": job_id,
@@ -137,10 +184,9 @@ def manual_update_rankings(
 
 @router.post("/update-tournaments")
 def manual_update_tournaments(
-    background_tasks: BackgroundTasks,
     start_year: int = Query(..., ge=1990, le=2030),
     end_year: int = Query(..., ge=1990, le=2030),
-    types: str = Query("atp"),
+    types: list[TournamentType] = Query(["atp"]),
     password: str = Query(...)
 ):
     """
@@ -149,68 +195,56 @@ def manual_update_tournaments(
     Args:
         start_year: Start year (inclusive)
         end_year: End year (inclusive)
-        types: Comma-separated tournament types (atp,gs,ch,fu)
+        types: Tournament types (atp, gs, ch, fu), one query parameter each
         password: Admin password
     """
     verify_password(password)
 
-    # Validate tournament types
-    type_list = [t.strip() for t in types.split(",")]
-    invalid = [t for t in type_list if t not in VALID_TOURNAMENT_TYPES]
-    if invalid:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid tournament types: {invalid}. Valid: {VALID_TOURNAMENT_TYPES}"
-        )
+    type_list = list(types)
 
     if start_year > end_year:
         raise HTTPException(status_code=400, detail="start_year must be <= end_year")
 
     job_id = f"tournaments_{start_year}_{end_year}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+    _queue_job(
+        job_id,
+        type="tournaments",
+        start_year=start_year,
+        end_year=end_year,
+        tournament_types=type_list
+    )
+
     def run_update():
+        from backend.scraper.tournament_scraper import scrape_tournaments_batch
+        from backend.scraper.http_utils import playwright_session
+
         try:
-            active_jobs[job_id] = {
-                "status": "running",
-                "type": "tournaments",
-                "start_year": start_year,
-                "end_year": end_year,
-                "tournament_types": type_list,
-                "started": datetime.now().isoformat()
-            }
+            _start_job(job_id)
 
-            new_tournaments = []
-            for year in range(start_year, end_year + 1):
-                for t_type in type_list:
-                    logger.info(f"Scraping {t_type} {year}...")
-                    new_tournaments.append(scrape_tournaments(year, t_type))
+            # Single browser session for all scrapes — avoids re-launching Chromium
+            with playwright_session() as ctx:
+                jobs = [(year, t_type) for year in range(start_year, end_year + 1) for t_type in type_list]
+                new_tournaments = [df for _, _, df in scrape_tournaments_batch(jobs, context=ctx)]
 
             if new_tournaments:
-                new_df = pl.concat(new_tournaments)
-                existing_df = load_tournaments(schema=TOURNAMENTS_SCHEMA)
-                combined_df = upsert_data(
-                    new_df, existing_df,
-                    ['year', 'tournament_type', 'tournament_name', 'start_date']
-                )
-                save_tournaments(combined_df)
-
-                completed_jobs.append({
-                    "job_id": job_id,
-                    "status": "completed",
+                new_df = pl.concat(new_tournaments, rechunk=False)
+                upsert_tournaments(new_df)
+                invalidate("tournaments")
+
+                _complete_job(job_id, {
                     "type": "tournaments",
                     "tournaments_scraped": len(new_df),
-                    "total_tournaments": len(combined_df),
-                    "completed": datetime.now().isoformat()
+                    "total_tournaments": scan_tournaments().select(pl.len()).collect().item()
                 })
-
-            del active_jobs[job_id]
+            else:
+                _complete_job(job_id)
 
         except Exception as e:
             logger.error(f"Tournament update failed: {e}")
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["error"] = str(e)
+            _fail_job(job_id, e)
 
-    background_tasks.add_task(run_update)
+    _job_executor.submit(run_update)
 
     return {
         "job_id": job_id,
@@ -224,7 +258,6 @@ def manual_update_tournaments(
 
 @router.post("/update-players")
 def manual_update_players(
-    background_tasks: BackgroundTasks,
     num_players: int = Query(10, ge=1, le=500),
     password: str = Query(...)
 ):
@@ -239,33 +272,27 @@ def manual_update_players(
 
     job_id = f"players_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
+    _queue_job(job_id, type="players", num_players=num_players)
+
     def run_update():
+        from backend.scraper.updater import update_player_bio
+
         try:
-            active_jobs[job_id] = {
-                "status": "running",
-                "type": "players",
-                "num_players": num_players,
-                "started": datetime.now().isoformat()
-            }
+            _start_job(job_id)
 
             count = update_player_bio(num_players)
+            invalidate("players")
 
-            completed_jobs.append({
-                "job_id": job_id,
-                "status": "completed",
+            _complete_job(job_id, {
                 "type": "players",
-                "players_updated": count,
-                "completed": datetime.now().isoformat()
+                "players_updated": count
             })
 
-            del active_jobs[job_id]
-
         except Exception as e:
             logger.error(f"Player update failed: {e}")
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["error"] = str(e)
+            _fail_job(job_id, e)
 
-    background_tasks.add_task(run_update)
+    _job_executor.submit(run_update)
 
     return {
         "job_id": job_id,
@@ -276,13 +303,37 @@ def manual_update_players(
 
 
 @router.get("/jobs")
-def get_jobs(password: str = Query(...)):
-    """Get status of all jobs (active and recent completed)."""
+def get_jobs(
+    password: str = Query(...),
+    since: Optional[datetime] = Query(None)
+):
+    """
+    Get status of all jobs (active and recent completed).
+
+    Args:
+        password: Admin password
+        since: Only include jobs completed at or after this time
+    """
     verify_password(password)
 
+    # Snapshot under the lock; the job thread keeps mutating active records
+    with _jobs_lock:
+        active = [dict(job) for job in active_jobs.values()]
+        completed = list(completed_jobs.values())
+
+    if since is not None:
+        # Job times are stored in UTC; a since without an offset is taken as UTC
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        since = since.astimezone(timezone.utc)
+        completed = [
+            job for job in completed
+            if datetime.fromisoformat(job["completed"]) >= since
+        ]
+
     return {
-        "active": list(active_jobs.values()),
-        "completed": completed_jobs[-20:]  # Last 20 completed jobs
+        "active": active,
+        "completed": completed[-20:]  # Last 20 completed jobs
     }
 
 
@@ -291,12 +342,13 @@ def get_job_status(job_id: str, password: str = Query(...)):
     """Get status of specific job."""
     verify_password(password)
 
-    if job_id in active_jobs:
-        return active_jobs[job_id]
+    with _jobs_lock:
+        job = active_jobs.get(job_id) or completed_jobs.get(job_id)
+        # Copy so serialization doesn't race with the job thread
+        job = dict(job) if job is not None else None
 
-    for job in completed_jobs:
-        if job["job_id"] == job_id:
-            return job
+    if job is not None:
+        return job
 
     raise HTTPException(status_code=404, detail="Job not found")
 
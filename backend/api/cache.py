@@ -0,0 +1,149 @@
+# backend/api/cache.py
+"""In-process cache of loaded datasets for the read endpoints."""
+
+import os
+import time
+import logging
+import threading
+from typing import Callable
+
+import polars as pl
+
+from backend.storage.s3_data_store import (
+    load_players,
+    load_singles_rankings,
+    load_doubles_rankings,
+    load_tournaments
+)
+
+logger = logging.getLogger(__name__)
+
+# Datasets change at most weekly; the admin update jobs invalidate explicitly
+CACHE_TTL_SECONDS = int(os.getenv("DATA_CACHE_TTL", "3600"))
+
+# Upper bound on memory held by encoded response bodies
+PAYLOAD_CACHE_BYTES = int(os.getenv("PAYLOAD_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+
+# Lowercased copies for case-insensitive filters; strip before serializing
+PLAYER_LOOKUP_COLUMNS = ["player_name_lower", "country_lower"]
+
+
+def _load_players() -> pl.DataFrame:
+    """Load players with lowercased name/country columns for case-insensitive filters."""
+    return load_players().with_columns(
+        pl.col("player_name").str.to_lowercase().alias("player_name_lower"),
+        pl.col("country").str.to_lowercase().alias("country_lower")
+    )
+
+
+_LOADERS: dict[str, Callable[[], pl.DataFrame]] = {
+    "players": _load_players,
+    "rankings:singles": load_singles_rankings,
+    "rankings:doubles": load_doubles_rankings,
+    "tournaments": load_tournaments,
+}
+
+# name -> (DataFrame, version, loaded_at)
+_cache: dict[str, tuple[pl.DataFrame, str, float]] = {}
+_lock = threading.Lock()
+
+# (name, version, *params) -> encoded response body, oldest first
+_payloads: dict[tuple, bytes] = {}
+_payload_bytes = 0
+_payload_lock = threading.Lock()
+
+
+def _content_version(df: pl.DataFrame) -> str:
+    """Fingerprint the frame's contents so reloads of unchanged data keep their version."""
+    return format(df.hash_rows(seed=0).sum() or 0, "x") + f"-{len(df)}"
+
+
+def get_entry(name: str) -> tuple[pl.DataFrame, str]:
+    """
+    Get a dataset and its content version, loading it on a miss or after TTL expiry.
+
+    Args:
+        name: 'players', 'tournaments', 'rankings:singles' or 'rankings:doubles'
+
+    Returns:
+        Tuple of (cached DataFrame (treat as read-only), version string)
+    """
+    entry = _cache.get(name)
+    if entry is not None and time.monotonic() - entry[2] < CACHE_TTL_SECONDS:
+        return entry[0], entry[1]
+
+    with _lock:
+        # Another thread may have loaded it while we waited
+        entry = _cache.get(name)
+        if entry is not None and time.monotonic() - entry[2] < CACHE_TTL_SECONDS:
+            return entry[0], entry[1]
+
+        df = _LOADERS[name]()
+        version = _content_version(df)
+        _cache[name] = (df, version, time.monotonic())
+        _drop_payloads(name, keep_version=version)
+        logger.info(f"Cached {name} ({len(df)} rows, version {version})")
+        return df, version
+
+
+def get_df(name: str) -> pl.DataFrame:
+    """Get a cached dataset by name (see get_entry)."""
+    return get_entry(name)[0]
+
+
+def get_payload(name: str, version: str, params: tuple, build: Callable[[], bytes]) -> bytes:
+    """
+    Get an encoded response body derived from a dataset version, building it on a miss.
+
+    Args:
+        name: Dataset the body was computed from
+        version: Dataset version returned by get_entry
+        params: Query parameters that determine the body
+        build: Computes the body when it is not cached
+
+    Returns:
+        Encoded response body
+    """
+    global _payload_bytes
+    key = (name, version, *params)
+    payload = _payloads.get(key)
+    if payload is not None:
+        return payload
+
+    payload = build()
+    if len(payload) > PAYLOAD_CACHE_BYTES:
+        return payload
+
+    with _payload_lock:
+        if key not in _payloads:
+            _payloads[key] = payload
+            _payload_bytes += len(payload)
+        # Evict oldest bodies until back under budget
+        while _payload_bytes > PAYLOAD_CACHE_BYTES:
+            _payload_bytes -= len(_payloads.pop(next(iter(_payloads))))
+    return payload
+
+
+def _drop_payloads(name: str | None = None, keep_version: str | None = None) -> None:
+    """Drop encoded bodies for a dataset (all if no name), except those of keep_version."""
+    global _payload_bytes
+    with _payload_lock:
+        stale = [
+            key for key in _payloads
+            if (name is None or key[0] == name) and key[1] != keep_version
+        ]
+        for key in stale:
+            _payload_bytes -= len(_payloads.pop(key))
+
+
+def invalidate(*names: str) -> None:
+    """Drop cached datasets so the next read reloads them (all if no names given)."""
+    with _lock:
+        if not names:
+            _cache.clear()
+            _drop_payloads()
+            return
+        for name in names:
+            _cache.pop(name, None)
+            _drop_payloads(name)
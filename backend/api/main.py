@@ -1,31 +1,51 @@
 # backend/api/main.py
 """FastAPI application for ATP Analytics."""
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from anyio import to_thread
+from contextlib import asynccontextmanager
+import asyncio
+import hashlib
 import os
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Literal, Optional, List
 import polars as pl
 
-# Import storage functions
-from backend.storage.s3_data_store import (
-    load_players,
-    load_singles_rankings,
-    load_doubles_rankings,
-    load_tournaments
+# Import cached dataset access
+from backend.api.cache import (
+    PLAYER_LOOKUP_COLUMNS, get_df, get_entry, get_payload, invalidate
 )
+from backend.api.search import get_name_index
+from backend.scraper.config import RankingType
+from backend.scraper.schemas import PLAYERS_SCHEMA
 
 # Import admin router
 from backend.api.admin import router as admin_router
 
+# Worker threads for blocking Polars/S3 work (Starlette's default is 40)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Widen the shared threadpool before serving requests."""
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+
 app = FastAPI(
     title="ATP Analytics API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -37,9 +57,77 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON/Arrow bodies; rankings histories run to several MB
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include admin router
 app.include_router(admin_router, prefix="/admin", tags=["admin"])
 
+# Response formats for the list endpoints
+ResponseFormat = Literal["json", "arrow", "ndjson"]
+MEDIA_TYPES = {
+    "json": "application/json",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "ndjson": "application/x-ndjson",
+}
+
+# Rows per chunk when streaming newline-delimited JSON
+NDJSON_CHUNK_ROWS = 256
+
+# Stored data changes at most weekly; search results are per-user and short-lived
+DATA_CACHE_CONTROL = "public, max-age=300"
+SEARCH_CACHE_CONTROL = "private, max-age=10"
+
+
+def _encode(df: pl.DataFrame, format: str = "json") -> bytes:
+    """Serialize a DataFrame as a JSON array of rows, NDJSON, or an Arrow IPC stream."""
+    buffer = BytesIO()
+    if format == "arrow":
+        df.write_ipc_stream(buffer)
+    elif format == "ndjson":
+        df.write_ndjson(buffer)
+    else:
+        # Row-oriented JSON straight from Arrow buffers, no per-row Python dicts
+        df.write_json(buffer)
+    return buffer.getvalue()
+
+
+def _payload_response(
+    content: bytes,
+    format: str = "json",
+    headers: Optional[dict] = None
+) -> Response:
+    """Wrap an encoded body in a response with the matching media type."""
+    return Response(content=content, media_type=MEDIA_TYPES[format], headers=headers)
+
+
+def _ndjson_chunks(df: pl.DataFrame) -> Iterator[bytes]:
+    """Encode a DataFrame as NDJSON a slice at a time."""
+    for chunk in df.iter_slices(NDJSON_CHUNK_ROWS):
+        yield chunk.write_ndjson().encode()
+
+
+def _to_response(
+    df: pl.DataFrame,
+    format: str = "json",
+    headers: Optional[dict] = None
+) -> Response:
+    """Serialize a DataFrame into a JSON or Arrow response."""
+    return _payload_response(_encode(df, format), format, headers)
+
+
+def _cache_headers(version: str) -> dict:
+    """Validator and caching headers for a response built from a cached dataset."""
+    return {"ETag": f'W/"{version}"', "Cache-Control": DATA_CACHE_CONTROL}
+
+
+def _is_not_modified(if_none_match: Optional[str], headers: dict) -> bool:
+    """Check whether the client's If-None-Match matches the response ETag."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or headers["ETag"] in tags
+
 # === API ROUTES ===
 
 @app.get("/health")
@@ -52,126 +140,239 @@ def health_check():
     }
 
 @app.get("/players/search")
-def search_players(q: str = Query(..., min_length=1)):
+async def search_players(
+    q: str = Query(..., min_length=1),
+    format: ResponseFormat = Query(default="json")
+):
     """Search for players by name."""
+    response = await run_in_threadpool(_search_players, q, format)
+    response.headers["Cache-Control"] = SEARCH_CACHE_CONTROL
+    return response
+
+
+def _search_players(q: str, format: str) -> Response:
+    """Blocking body of search_players."""
     try:
-        players_df = load_players()
+        players_df = get_df("players")
 
         if players_df is None or len(players_df) == 0:
-            return []
-
-        # Filter players by search query
-        mask = players_df["player_name"].str.to_lowercase().str.contains(q.lower())
-        results = players_df.filter(mask)
+            return _to_response(players_df.drop(PLAYER_LOOKUP_COLUMNS), format)
+
+        # Look up via the name index; short queries fall back to a column scan
+        query = q.lower()
+        indices = get_name_index(players_df).search(query)
+        if indices is None:
+            results = players_df.filter(
+                pl.col("player_name_lower").str.contains(query, literal=True)
+            )
+        elif indices:
+            results = players_df[indices]
+        else:
+            results = players_df.clear()
 
-        return results.to_dicts()
+        return _to_response(results.drop(PLAYER_LOOKUP_COLUMNS), format)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/rankings/stored")
-def get_stored_rankings(
-    ranking_type: str = Query(default="singles", pattern="^(singles|doubles)$"),
+async def get_stored_rankings(
+    ranking_type: RankingType = Query(default="singles"),
     player_ids: Optional[str] = Query(default=None),
     limit: int = Query(default=1000, le=5000),  # Increased default
-    latest_only: bool = Query(default=False)
+    latest_only: bool = Query(default=False),
+    format: ResponseFormat = Query(default="json"),
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """Get stored ranking history."""
+    return await run_in_threadpool(
+        _get_stored_rankings, ranking_type, player_ids, limit, latest_only, format,
+        if_none_match
+    )
+
+
+def _get_stored_rankings(
+    ranking_type: str,
+    player_ids: Optional[str],
+    limit: int,
+    latest_only: bool,
+    format: str,
+    if_none_match: Optional[str]
+) -> Response:
+    """Blocking body of get_stored_rankings."""
     try:
-        if ranking_type == "singles":
-            df = load_singles_rankings()
-        else:
-            df = load_doubles_rankings()
-        
-        if df is None or len(df) == 0:
-            return []
-        
-        # Filter by player IDs if provided
-        if player_ids:
-            player_id_list = [pid.strip() for pid in player_ids.split(",")]
-            df = df.filter(df["player_id"].is_in(player_id_list))
-            # When specific players requested, return ALL their data
-            # Don't apply limit - chart needs complete history
-            return df.sort("date").to_dicts()
-        
-        # Get only latest ranking per player
-        if latest_only:
-            df = df.sort("date", descending=True).group_by("player_id").head(1)
-            # Sort by rank for leaderboard display
-            if "rank" in df.columns:
-                df = df.sort("rank")
-        else:
-            # For general queries, sort by date
-            df = df.sort("date")
-        
-        # Apply limit only for non-specific queries
-        df = df.head(limit)
-        
-        return df.to_dicts()
+        name = f"rankings:{ranking_type}"
+        df, version = get_entry(name)
+        headers = _cache_headers(version)
+
+        # Same data version means the same result for this URL; skip the work
+        if _is_not_modified(if_none_match, headers):
+            return Response(status_code=304, headers=headers)
+
+        # Large histories stream row chunks instead of building one body
+        if format == "ndjson":
+            return StreamingResponse(
+                _ndjson_chunks(_query_rankings(df, player_ids, limit, latest_only)),
+                media_type=MEDIA_TYPES[format],
+                headers=headers
+            )
+
+        # Encoded bodies are reused until the dataset version changes
+        params = (player_ids, limit, latest_only, format)
+        content = get_payload(
+            name, version, params,
+            lambda: _encode(_query_rankings(df, player_ids, limit, latest_only), format)
+        )
+        return _payload_response(content, format, headers)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+def _query_rankings(
+    df: pl.DataFrame,
+    player_ids: Optional[str],
+    limit: int,
+    latest_only: bool
+) -> pl.DataFrame:
+    """Select the rankings rows for a /rankings/stored query."""
+    if df is None or len(df) == 0:
+        return df
+
+    # Build one lazy plan so filter/sort/limit are optimized together
+    lf = df.lazy()
+
+    # Filter by player IDs if provided
+    if player_ids:
+        player_id_list = [pid.strip() for pid in player_ids.split(",")]
+        lf = lf.filter(pl.col("player_id").is_in(player_id_list))
+        # When specific players requested, return ALL their data
+        # Don't apply limit - chart needs complete history
+        return lf.sort("date").collect()
+
+    # Get only latest ranking per player
+    if latest_only:
+        # Latest dated row per player, as sort + first-per-group
+        lf = lf.sort("date", descending=True, nulls_last=True).unique(
+            subset=["player_id"], keep="first", maintain_order=True
+        )
+        # Sort by rank for leaderboard display
+        if "rank" in df.columns:
+            lf = lf.sort("rank")
+    else:
+        # For general queries, sort by date
+        lf = lf.sort("date")
+
+    # Apply limit only for non-specific queries
+    return lf.head(limit).collect()
+
 @app.get("/tournaments")
-def get_tournaments(
+async def get_tournaments(
     year: Optional[int] = None,
-    tournament_type: Optional[str] = None
+    tournament_type: Optional[str] = None,
+    format: ResponseFormat = Query(default="json"),
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """Get tournament data."""
+    return await run_in_threadpool(
+        _get_tournaments, year, tournament_type, format, if_none_match
+    )
+
+
+def _get_tournaments(
+    year: Optional[int],
+    tournament_type: Optional[str],
+    format: str,
+    if_none_match: Optional[str]
+) -> Response:
+    """Blocking body of get_tournaments."""
     try:
-        df = load_tournaments()
-
-        if df is None or len(df) == 0:
-            return []
-
-        # Apply filters
-        if year:
-            df = df.filter(df["year"] == year)
+        df, version = get_entry("tournaments")
+        headers = _cache_headers(version)
 
-        if tournament_type:
-            df = df.filter(df["tournament_type"] == tournament_type)
+        if _is_not_modified(if_none_match, headers):
+            return Response(status_code=304, headers=headers)
 
-        return df.to_dicts()
+        content = get_payload(
+            "tournaments", version, (year, tournament_type, format),
+            lambda: _encode(_query_tournaments(df, year, tournament_type), format)
+        )
+        return _payload_response(content, format, headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _query_tournaments(
+    df: pl.DataFrame,
+    year: Optional[int],
+    tournament_type: Optional[str]
+) -> pl.DataFrame:
+    """Select the tournament rows for a /tournaments query."""
+    if df is None or len(df) == 0:
+        return df
+
+    # Apply filters as one lazy plan
+    lf = df.lazy()
+    if year:
+        lf = lf.filter(pl.col("year") == year)
+
+    if tournament_type:
+        lf = lf.filter(pl.col("tournament_type") == tournament_type)
+
+    return lf.collect()
     
+# Bio filter for /players, built once against the players schema
+_BIO_FIELDS = [
+    field for field in ("birthdate", "weight_kg", "height_cm", "country", "handedness")
+    if field in PLAYERS_SCHEMA
+]
+_HAS_BIO_EXPR = pl.any_horizontal([pl.col(field).is_not_null() for field in _BIO_FIELDS])
+_NO_BIO_EXPR = pl.all_horizontal([pl.col(field).is_null() for field in _BIO_FIELDS])
+
 @app.get("/players")
-def get_players(
+async def get_players(
     country: Optional[str] = None,
     limit: int = Query(default=100, le=500),
-    has_bio: Optional[bool] = None
+    has_bio: Optional[bool] = None,
+    if_none_match: Optional[str] = Header(default=None)
 ):
     """Get all players with optional filtering."""
+    return await run_in_threadpool(_get_players, country, limit, has_bio, if_none_match)
+
+
+def _get_players(
+    country: Optional[str],
+    limit: int,
+    has_bio: Optional[bool],
+    if_none_match: Optional[str]
+) -> Response:
+    """Blocking body of get_players."""
     try:
-        players_df = load_players()
+        players_df, version = get_entry("players")
+        headers = _cache_headers(version)
+
+        if _is_not_modified(if_none_match, headers):
+            return Response(status_code=304, headers=headers)
+
         if players_df is None or len(players_df) == 0:
-            return []
+            return _to_response(pl.DataFrame(), headers=headers)
         
+        # Build one lazy plan so the limit stops filtering early
+        lf = players_df.lazy()
+
         # Filter by country
         if country:
-            mask = players_df["country"].str.to_lowercase().str.contains(country.lower())
-            players_df = players_df.filter(mask)
+            lf = lf.filter(
+                pl.col("country_lower").str.contains(country.lower(), literal=True)
+            )
         
         # Filter by bio data
         if has_bio is not None:
-            bio_fields = ["birthdate", "weight_kg", "height_cm", "country", "handedness"]
-            if has_bio:
-                mask = pl.any_horizontal([
-                    pl.col(field).is_not_null() 
-                    for field in bio_fields 
-                    if field in players_df.columns
-                ])
-            else:
-                mask = pl.all_horizontal([
-                    pl.col(field).is_null() 
-                    for field in bio_fields 
-                    if field in players_df.columns
-                ])
-            players_df = players_df.filter(mask)
+            lf = lf.filter(_HAS_BIO_EXPR if has_bio else _NO_BIO_EXPR)
         
         # Apply limit
-        players_df = players_df.head(limit)
+        players_df = lf.head(limit).drop(PLAYER_LOOKUP_COLUMNS).collect()
         
-        return players_df.to_dicts()
+        return _to_response(players_df, headers=headers)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -179,15 +380,20 @@ def get_players(
 # === TASK ENDPOINTS ===
 
 @app.post("/tasks/update-weekly")
-def update_weekly():
+async def update_weekly():
     """Weekly data update task (called by EventBridge)."""
     from backend.scraper.updater import update_rankings, update_player_bio
 
     try:
-        # Run updates
-        singles_weeks = update_rankings("singles", max_weeks=2)
-        doubles_weeks = update_rankings("doubles", max_weeks=2)
-        players_updated = update_player_bio(num_players=10)
+        # Singles and doubles are independent scrapes; each thread opens its
+        # own browser since Playwright's sync API is bound to one thread
+        singles_weeks, doubles_weeks = await asyncio.gather(
+            asyncio.to_thread(update_rankings, "singles", 2),
+            asyncio.to_thread(update_rankings, "doubles", 2)
+        )
+        # Bio priority depends on the freshly saved rankings
+        players_updated = await asyncio.to_thread(update_player_bio, 10)
+        invalidate()
 
         result = {
             "singles_weeks": singles_weeks,
@@ -213,64 +419,78 @@ def update_weekly():
 # Get static directory path
 STATIC_DIR = Path(__file__).parent.parent / "static"
 
-# Mount static assets (CSS, JS, images)
-if STATIC_DIR.exists():
-    assets_dir = STATIC_DIR / "assets"
-    if assets_dir.exists():
-        app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
-
-    @app.get("/favicon.ico")
-    @app.head("/favicon.ico")
-    def serve_favicon_ico():
-        """Serve favicon.ico."""
-        favicon_path = STATIC_DIR / "favicon.ico"
-        if favicon_path.exists():
-            return FileResponse(favicon_path, media_type="image/x-icon")
-        raise HTTPException(status_code=404)
+# Root-level files from the frontend build, served by the catch-all route
+STATIC_ASSETS = {
+    "favicon.ico": "image/x-icon",
+    "favicon.png": "image/png",
+    "logo.png": "image/png",
+    "logo.svg": "image/svg+xml",
+    "vite.svg": "image/svg+xml",
+}
+
+# Vite fingerprints /assets filenames, so they never change under the same URL;
+# root icons are unversioned and index.html must pick up new deploys immediately
+HASHED_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+ROOT_ASSET_CACHE_CONTROL = "public, max-age=86400"
+INDEX_CACHE_CONTROL = "no-cache"
+
+
+class HashedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers cache fingerprinted build assets indefinitely."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = HASHED_ASSET_CACHE_CONTROL
+        return response
+
+
+def _read_static(name: str, media_type: str, cache_control: str) -> Optional[tuple[bytes, dict]]:
+    """Read a small build file into memory with its response headers (None if absent)."""
+    path = STATIC_DIR / name
+    if not path.exists():
+        return None
+    content = path.read_bytes()
+    return content, {
+        "Content-Type": media_type,
+        "ETag": f'"{hashlib.sha256(content).hexdigest()[:16]}"',
+        "Cache-Control": cache_control,
+    }
 
-    @app.get("/favicon.png")
-    @app.head("/favicon.png")
-    def serve_favicon_png():
-        """Serve favicon.png."""
-        favicon_path = STATIC_DIR / "favicon.png"
-        if favicon_path.exists():
-            return FileResponse(favicon_path, media_type="image/png")
-        raise HTTPException(status_code=404)
 
-    @app.get("/logo.png")
-    @app.head("/logo.png")
-    def serve_logo_png():
-        """Serve logo.png."""
-        logo_path = STATIC_DIR / "logo.png"
-        if logo_path.exists():
-            return FileResponse(logo_path, media_type="image/png")
-        raise HTTPException(status_code=404)
+def _static_response(entry: tuple[bytes, dict], if_none_match: Optional[str]) -> Response:
+    """Serve an in-memory build file, or 304 if the client already has it."""
+    content, headers = entry
+    if _is_not_modified(if_none_match, headers):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, headers=headers)
 
-    @app.get("/logo.svg")
-    @app.head("/logo.svg")
-    def serve_logo_svg():
-        """Serve logo.svg."""
-        logo_path = STATIC_DIR / "logo.svg"
-        if logo_path.exists():
-            return FileResponse(logo_path, media_type="image/svg+xml")
-        raise HTTPException(status_code=404)
 
-    @app.get("/vite.svg")
-    @app.head("/vite.svg")
-    def serve_vite_svg():
-        """Serve vite.svg."""
-        svg_path = STATIC_DIR / "vite.svg"
-        if svg_path.exists():
-            return FileResponse(svg_path)
-        raise HTTPException(status_code=404)
+# The build is baked into the image, so read these once at startup
+_STATIC_FILES = {
+    name: entry
+    for name, media_type in STATIC_ASSETS.items()
+    if (entry := _read_static(name, media_type, ROOT_ASSET_CACHE_CONTROL)) is not None
+}
+_INDEX_HTML = _read_static("index.html", "text/html; charset=utf-8", INDEX_CACHE_CONTROL)
+
+# Unmatched paths under these top-level segments are API 404s, not SPA routes
+API_ROOTS = frozenset({
+    "api", "docs", "redoc", "admin", "tasks", "health",
+    "players", "rankings", "tournaments",
+})
+
+# Mount static assets (CSS, JS, images)
+if STATIC_DIR.exists():
+    assets_dir = STATIC_DIR / "assets"
+    if assets_dir.exists():
+        app.mount("/assets", HashedStaticFiles(directory=str(assets_dir)), name="assets")
 
 # Serve React app at root (MUST BE LAST!)
 @app.get("/", include_in_schema=False)
-async def serve_frontend():
+async def serve_frontend(if_none_match: Optional[str] = Header(default=None)):
     """Serve the React frontend index.html."""
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    if _INDEX_HTML is not None:
+        return _static_response(_INDEX_HTML, if_none_match)
     # Fallback if frontend not built
     return {
         "name": "ATP Analytics API",
@@ -281,24 +501,22 @@ async def serve_frontend():
 
 # Catch-all route for React Router (SPA routing)
 @app.get("/{full_path:path}", include_in_schema=False)
-async def serve_spa(full_path: str):
+@app.head("/{full_path:path}", include_in_schema=False)
+async def serve_spa(full_path: str, if_none_match: Optional[str] = Header(default=None)):
     """
     Catch-all route for Single Page Application routing.
-    Serves index.html for any non-API routes.
+    Serves whitelisted root-level assets, and index.html for any non-API routes.
     """
+    if full_path in STATIC_ASSETS:
+        entry = _STATIC_FILES.get(full_path)
+        if entry is None:
+            raise HTTPException(status_code=404)
+        return _static_response(entry, if_none_match)
+
     # Don't intercept API routes, docs, or admin
-    if (full_path.startswith("api/") or 
-        full_path.startswith("docs") or 
-        full_path.startswith("redoc") or
-        full_path.startswith("admin/") or
-        full_path.startswith("tasks/") or
-        full_path.startswith("health") or
-        full_path.startswith("players/") or
-        full_path.startswith("rankings/") or
-        full_path.startswith("tournaments")):
+    if full_path.split("/", 1)[0] in API_ROOTS:
         raise HTTPException(status_code=404)
 
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    if _INDEX_HTML is not None:
+        return _static_response(_INDEX_HTML, if_none_match)
     raise HTTPException(status_code=404)
\ No newline at end of file
@@ -0,0 +1,55 @@
+# backend/api/search.py
+"""Substring index for player name search."""
+
+from collections import defaultdict
+
+import polars as pl
+
+NGRAM_SIZE = 3
+
+
+class NameIndex:
+    """Trigram inverted index over lowercased names, mapping n-grams to row indices."""
+
+    def __init__(self, names: list[str | None]):
+        self._names = names
+        postings: dict[str, set[int]] = defaultdict(set)
+        for i, name in enumerate(names):
+            if not name:
+                continue
+            for j in range(len(name) - NGRAM_SIZE + 1):
+                postings[name[j:j + NGRAM_SIZE]].add(i)
+        self._postings = dict(postings)
+
+    def search(self, query: str) -> list[int] | None:
+        """
+        Find rows whose name contains the query.
+
+        Args:
+            query: Lowercased search string
+
+        Returns:
+            Matching row indices in table order, or None if the query is too
+            short to use the index
+        """
+        if len(query) < NGRAM_SIZE:
+            return None
+
+        grams = {query[j:j + NGRAM_SIZE] for j in range(len(query) - NGRAM_SIZE + 1)}
+        hits = sorted((self._postings.get(g, set()) for g in grams), key=len)
+        candidates = set.intersection(*hits) if hits[0] else set()
+
+        # Trigram hits are necessary but not sufficient; confirm the substring
+        return sorted(i for i in candidates if query in self._names[i])
+
+
+# Index is built once per cached players frame
+_index: tuple[pl.DataFrame, NameIndex] | None = None
+
+
+def get_name_index(players_df: pl.DataFrame) -> NameIndex:
+    """Get the name index for the given players frame, building it on first use."""
+    global _index
+    if _index is None or _index[0] is not players_df:
+        _index = (players_df, NameIndex(players_df["player_name_lower"].to_list()))
+    return _index[1]
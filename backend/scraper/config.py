@@ -1,10 +1,23 @@
 # backend/scraper/config.py
 """Configuration and constants for scraping."""
 
+import os
+from typing import Literal, get_args
+
 # HTTP Configuration
 REQUEST_TIMEOUT = 30.0
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 2  # Exponential: 1s, 2s, 4s
+PAGE_CONCURRENCY = 4  # Ranking weeks loading in parallel tabs
+REQUESTS_PER_SECOND = 4.0  # Page loads started per second, across all scrapers
+
+# Scraped page cache: a re-run within the TTL reuses what was extracted last time
+SCRAPE_CACHE_PATH = os.getenv("SCRAPE_CACHE_PATH", "data/scrape_cache.sqlite")
+RANKING_CACHE_TTL = 7 * 24 * 3600
+PLAYER_CACHE_TTL = 30 * 24 * 3600
+
+# Ranking Types
+RankingType = Literal["singles", "doubles"]
 
 # ATP Tour URLs
 ATP_BASE_URL = "https://www.atptour.com"
@@ -16,7 +29,8 @@ RESULTS_ARCHIVE_URL = f"{ATP_BASE_URL}/en/scores/results-archive"
 PLAYER_OVERVIEW_URL = f"{ATP_BASE_URL}/en/players"
 
 # Tournament Types
-VALID_TOURNAMENT_TYPES = {'gs', 'atp', 'ch', 'fu'}
+TournamentType = Literal['gs', 'atp', 'ch', 'fu']
+VALID_TOURNAMENT_TYPES = set(get_args(TournamentType))
 
 # Month Mapping
 MONTH_MAP = {
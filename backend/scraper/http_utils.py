@@ -2,9 +2,13 @@
 """Shared Playwright browser session for all scrapers."""
 
 import logging
+import threading
+import time
 from contextlib import contextmanager
 from playwright.sync_api import sync_playwright
 
+from backend.scraper.config import REQUESTS_PER_SECOND
+
 logger = logging.getLogger(__name__)
 
 _BROWSER_ARGS = [
@@ -28,6 +32,23 @@ _ABORT_URL_FRAGMENTS = {
     "players/profile/widget", "partners/footer", "webxp/projects",
 }
 
+# Earliest time the next page load may start; shared so parallel tabs and jobs
+# together stay under REQUESTS_PER_SECOND
+_next_request_at = 0.0
+_throttle_lock = threading.Lock()
+
+
+def throttle() -> None:
+    """Block until another page load may start without exceeding REQUESTS_PER_SECOND."""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + 1 / REQUESTS_PER_SECOND
+    if wait > 0:
+        time.sleep(wait)
+
+
 def _handle_route(route, request) -> None:
     rtype = request.resource_type
     if rtype in _ABORT_TYPES:
@@ -48,4 +69,14 @@ def playwright_session():
             ctx.route("**/*", _handle_route)
             yield ctx
         finally:
-            browser.close()
\ No newline at end of file
+            browser.close()
+
+
+@contextmanager
+def browser_context(context=None):
+    """Yield the given browser context, or open a new session if none is given."""
+    if context is not None:
+        yield context
+    else:
+        with playwright_session() as ctx:
+            yield ctx
\ No newline at end of file
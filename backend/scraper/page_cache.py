@@ -0,0 +1,52 @@
+# backend/scraper/page_cache.py
+"""SQLite cache of data extracted from scraped pages, keyed by URL."""
+
+import json
+import logging
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from backend.scraper.config import SCRAPE_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it on first use."""
+    path = Path(SCRAPE_CACHE_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, fetched_at REAL, data TEXT)"
+    )
+    return conn
+
+
+def get_cached(url: str, max_age: float) -> Any | None:
+    """Return the data extracted from `url` if it was stored less than `max_age` seconds ago."""
+    try:
+        # The connection's own context manager only commits; closing() releases it
+        with closing(_connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT data FROM pages WHERE url = ? AND fetched_at > ?",
+                (url, time.time() - max_age)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"Page cache read failed: {e}")
+        return None
+    return json.loads(row[0]) if row else None
+
+
+def put_cached(url: str, data: Any) -> None:
+    """Store the data extracted from `url`."""
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages (url, fetched_at, data) VALUES (?, ?, ?)",
+                (url, time.time(), json.dumps(data))
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"Page cache write failed: {e}")
@@ -3,30 +3,42 @@
 
 import logging
 import re
+from collections import deque
+from html.parser import HTMLParser
+from typing import Callable
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from backend.scraper.config import PLAYER_OVERVIEW_URL, MAX_RETRIES
-from backend.scraper.http_utils import playwright_session
+from backend.scraper.config import (
+    PLAYER_OVERVIEW_URL, MAX_RETRIES, PAGE_CONCURRENCY, PLAYER_CACHE_TTL
+)
+from backend.scraper.http_utils import browser_context, throttle
+from backend.scraper.page_cache import get_cached, put_cached
 
 logger = logging.getLogger(__name__)
 
+_DATE_RE = re.compile(r'(\d{4})/(\d{2})/(\d{2})')
+_WEIGHT_KG_RE = re.compile(r'\((\d+)kg\)')
+_WEIGHT_LBS_RE = re.compile(r'(\d+)\s*lbs')
+_HEIGHT_CM_RE = re.compile(r'\((\d+)cm\)')
+_HEIGHT_FTIN_RE = re.compile(r"(\d+)'(\d+)\"")
+
 
 def _extract_date(text: str) -> str | None:
-    if m := re.search(r'(\d{4})/(\d{2})/(\d{2})', text):
+    if m := _DATE_RE.search(text):
         return m.group(0)
     return None
 
 def _extract_weight_kg(text: str) -> int | None:
-    if m := re.search(r'\((\d+)kg\)', text):
+    if m := _WEIGHT_KG_RE.search(text):
         return int(m.group(1))
-    if m := re.search(r'(\d+)\s*lbs', text):
+    if m := _WEIGHT_LBS_RE.search(text):
         return round(int(m.group(1)) * 0.453592)
     return None
 
 def _extract_height_cm(text: str) -> int | None:
-    if m := re.search(r'\((\d+)cm\)', text):
+    if m := _HEIGHT_CM_RE.search(text):
         return int(m.group(1))
-    if m := re.search(r"(\d+)'(\d+)\"", text):
+    if m := _HEIGHT_FTIN_RE.search(text):
         feet, inches = int(m.group(1)), int(m.group(2))
         return round((feet * 12 + inches) * 2.54)
     return None
@@ -37,10 +49,131 @@ def _parse_plays(text: str) -> tuple[str | None, str | None]:
     return handedness, backhand
 
 
+# Overview label -> parser returning the bio fields it sets
+_LABEL_PARSERS: dict[str, Callable[[str], dict]] = {
+    "Age": lambda value: {"birthdate": _extract_date(value)},
+    "DOB": lambda value: {"birthdate": _extract_date(value)},
+    "Weight": lambda value: {"weight_kg": _extract_weight_kg(value)},
+    "Height": lambda value: {"height_cm": _extract_height_cm(value)},
+    "Turned pro": lambda value: {"turned_pro": int(value) if value.isdigit() else None},
+    "Country": lambda value: {"country": value.split("\n")[0].strip() or None},
+    "Birthplace": lambda value: {"birthplace": value or None},
+    "Plays": lambda value: dict(zip(("handedness", "backhand"), _parse_plays(value))),
+    "Coach": lambda value: {"coach": value or None},
+}
+
+
+def _player_url(player_id: str, player_slug: str) -> str:
+    """Overview page URL for one player."""
+    return f"{PLAYER_OVERVIEW_URL}/{player_slug}/{player_id}/overview"
+
+
+def _parse_items(player_id: str, items: list[dict]) -> dict:
+    """Map the overview's label/value pairs to player bio fields."""
+    data: dict = {}
+    for item in items:
+        if parse := _LABEL_PARSERS.get(item["label"]):
+            data.update(parse(item["value"]))
+
+    logger.info(f"Scraped player {player_id}: {data}")
+    return data
+
+
+class _BioItemsParser(HTMLParser):
+    """Collect label/value pairs from `div.pd_content li > span` in raw HTML."""
+
+    _VOID_TAGS = {
+        "area", "base", "br", "col", "embed", "hr", "img", "input",
+        "link", "meta", "source", "track", "wbr",
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.items: list[dict] = []
+        self._stack: list[str] = []
+        self._content_depth: int | None = None
+        self._li_depth: int | None = None
+        self._span_depth: int | None = None
+        self._spans: list[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._VOID_TAGS:
+            return
+        self._stack.append(tag)
+        depth = len(self._stack)
+        classes = (dict(attrs).get("class") or "").split()
+        if self._content_depth is None:
+            if tag == "div" and "pd_content" in classes:
+                self._content_depth = depth
+        elif tag == "li" and self._li_depth is None:
+            self._li_depth, self._spans = depth, []
+        elif tag == "span" and self._li_depth is not None and depth == self._li_depth + 1:
+            self._span_depth = depth
+            self._spans.append("")
+
+    def handle_data(self, data):
+        if self._span_depth is not None:
+            self._spans[-1] += data
+
+    def handle_endtag(self, tag):
+        if tag not in self._stack:
+            return
+        # Tolerate unclosed children by popping back to the matching tag
+        depth = len(self._stack) - self._stack[::-1].index(tag)
+        del self._stack[depth - 1:]
+        if self._span_depth is not None and depth <= self._span_depth:
+            self._span_depth = None
+        if self._li_depth is not None and depth <= self._li_depth:
+            if len(self._spans) >= 2:
+                self.items.append({"label": self._spans[0].strip(), "value": self._spans[1].strip()})
+            self._li_depth = None
+        if self._content_depth is not None and depth <= self._content_depth:
+            self._content_depth = None
+
+
+def _scrape_player_static(ctx, player_id: str, player_slug: str) -> dict | None:
+    """
+    Scrape a player from the raw overview HTML without rendering the page.
+
+    Uses the browser context's request client, so cookies are shared with
+    the rendered path. Returns None if the bio block is not in the HTML.
+    """
+    try:
+        throttle()
+        response = ctx.request.get(_player_url(player_id, player_slug), timeout=15000)
+        if not response.ok:
+            return None
+        parser = _BioItemsParser()
+        parser.feed(response.text())
+    except Exception as e:
+        logger.debug(f"Static fetch failed for {player_id}: {e}")
+        return None
+    if not parser.items:
+        return None
+    put_cached(_player_url(player_id, player_slug), parser.items)
+    return _parse_items(player_id, parser.items)
+
+
+# Consecutive static fetch misses after which a batch stops trying plain HTML
+# (the site may only serve the bio block with JS); counted per batch, so one
+# timeout or 5xx never disables the static path for the whole process
+STATIC_BIO_MAX_MISSES = 3
+
+
+def _open_player(ctx, player_id: str, player_slug: str):
+    """Open a page and start loading a player overview; returns (page, error)."""
+    url = _player_url(player_id, player_slug)
+    page = ctx.new_page()
+    try:
+        throttle()
+        page.goto(url, wait_until="commit", timeout=15000)
+        return page, None
+    except Exception as e:
+        return page, e
+
+
 def _scrape_player(page, player_id: str, player_slug: str) -> dict:
-    """Scrape one player using an existing Playwright page."""
-    url = f"{PLAYER_OVERVIEW_URL}/{player_slug}/{player_id}/overview"
-    page.goto(url, wait_until="domcontentloaded", timeout=15000)
+    """Scrape one player from a page that is loading their overview."""
     page.wait_for_selector("div.pd_content", timeout=15000)
 
     items = page.evaluate("""
@@ -54,58 +187,82 @@ def _scrape_player(page, player_id: str, player_slug: str) -> dict:
         }).filter(Boolean)
     """)
 
-    data: dict = {}
-    for item in items:
-        label, value = item["label"], item["value"]
-        if label in ("Age", "DOB"):
-            data["birthdate"] = _extract_date(value)
-        elif label == "Weight":
-            data["weight_kg"] = _extract_weight_kg(value)
-        elif label == "Height":
-            data["height_cm"] = _extract_height_cm(value)
-        elif label == "Turned pro":
-            data["turned_pro"] = int(value) if value.isdigit() else None
-        elif label == "Country":
-            data["country"] = value.split("\n")[0].strip() or None
-        elif label == "Birthplace":
-            data["birthplace"] = value or None
-        elif label == "Plays":
-            data["handedness"], data["backhand"] = _parse_plays(value)
-        elif label == "Coach":
-            data["coach"] = value or None
-
-    logger.info(f"Scraped player {player_id}: {data}")
-    return data
+    if items:
+        put_cached(_player_url(player_id, player_slug), items)
+    return _parse_items(player_id, items)
 
 
-def scrape_players_batch(players: list[tuple[str, str]], max_retries: int = MAX_RETRIES) -> dict[str, dict]:
+def scrape_players_batch(
+    players: list[tuple[str, str]],
+    max_retries: int = MAX_RETRIES,
+    context=None,
+    concurrency: int = PAGE_CONCURRENCY
+) -> dict[str, dict]:
     """
     Scrape multiple players using a single shared browser session.
 
+    Overviews read within PLAYER_CACHE_TTL come from the page cache. Other
+    players are first fetched as plain HTML, which carries the bio block when
+    the site serves it without JS; after STATIC_BIO_MAX_MISSES misses in a row
+    the batch stops trying. The rest load in up to `concurrency` browser
+    pages at once, each read while the others keep loading.
+
     Args:
         players: list of (player_id, player_slug)
+        context: Existing browser context to reuse (opens one if None)
+        concurrency: Maximum number of pages in flight
     Returns:
         Mapping of player_id -> scraped data dict
     """
+    static_misses = 0
     results: dict[str, dict] = {}
+    pending: deque = deque()
+    in_flight: deque = deque()
 
-    with playwright_session() as ctx:
+    with browser_context(context) as ctx:
         for player_id, player_slug in players:
-            for attempt in range(max_retries):
-                page = ctx.new_page()
-                try:
-                    data = _scrape_player(page, player_id, player_slug)
-                    if data:
-                        results[player_id] = data
-                    break
-                except PlaywrightTimeoutError:
-                    logger.warning(f"Timeout scraping {player_id}, attempt {attempt + 1}/{max_retries}")
-                    if attempt == max_retries - 1:
-                        logger.error(f"Failed to scrape player {player_id} after {max_retries} attempts")
-                except Exception as e:
-                    logger.error(f"Error scraping {player_id}: {type(e).__name__}: {e}", exc_info=True)
-                    break
-                finally:
-                    page.close()
-
-    return results
\ No newline at end of file
+            cached = get_cached(_player_url(player_id, player_slug), PLAYER_CACHE_TTL)
+            if cached is not None:
+                if data := _parse_items(player_id, cached):
+                    results[player_id] = data
+                continue
+            if static_misses < STATIC_BIO_MAX_MISSES:
+                data = _scrape_player_static(ctx, player_id, player_slug)
+                if data is not None:
+                    static_misses = 0
+                else:
+                    static_misses += 1
+                    if static_misses == STATIC_BIO_MAX_MISSES:
+                        logger.info("Static player overview fetch unavailable; rendering pages instead")
+                if data:
+                    results[player_id] = data
+                    continue
+            pending.append((player_id, player_slug, 1))
+
+        while pending or in_flight:
+            while pending and len(in_flight) < concurrency:
+                player_id, player_slug, attempt = pending.popleft()
+                in_flight.append(
+                    (player_id, player_slug, attempt, *_open_player(ctx, player_id, player_slug))
+                )
+
+            player_id, player_slug, attempt, page, error = in_flight.popleft()
+            try:
+                if error is not None:
+                    raise error
+                data = _scrape_player(page, player_id, player_slug)
+                if data:
+                    results[player_id] = data
+            except PlaywrightTimeoutError:
+                logger.warning(f"Timeout scraping {player_id}, attempt {attempt}/{max_retries}")
+                if attempt < max_retries:
+                    # Retry next, ahead of players not yet started
+                    pending.appendleft((player_id, player_slug, attempt + 1))
+                else:
+                    logger.error(f"Failed to scrape player {player_id} after {max_retries} attempts")
+            except Exception as e:
+                logger.error(f"Error scraping {player_id}: {type(e).__name__}: {e}", exc_info=True)
+            finally:
+                page.close()
+
+    return results
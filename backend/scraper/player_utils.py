@@ -3,6 +3,10 @@
 
 import re
 
+_SLUG_CLEAN_RE = re.compile(r'[^a-z0-9-]')
+# Player ID is the path segment after the slug: /players/{slug}/{id}/...
+PLAYER_ID_PATTERN = r'/players/[^/]+/([^/]+)/'
+_PLAYER_ID_RE = re.compile(PLAYER_ID_PATTERN)
 
 def generate_player_slug(player_name: str) -> str:
     """
@@ -14,7 +18,7 @@ def generate_player_slug(player_name: str) -> str:
     Returns:
         URL-safe slug
     """
-    return re.sub(r'[^a-z0-9-]', '', player_name.lower().replace(' ', '-'))
+    return _SLUG_CLEAN_RE.sub('', player_name.lower().replace(' ', '-'))
 
 
 def extract_player_id(href: str | list | None) -> str | None:
@@ -29,5 +33,5 @@ def extract_player_id(href: str | list | None) -> str | None:
     """
     if not isinstance(href, str):
         return None
-    match = re.search(r'/players/[^/]+/([^/]+)/', href)
+    match = _PLAYER_ID_RE.search(href)
     return match.group(1) if match else None
\ No newline at end of file
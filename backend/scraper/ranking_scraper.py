@@ -2,26 +2,21 @@
 """Scrape ATP rankings data."""
 
 import logging
+from collections import deque
+from typing import Iterator
+
 import polars as pl
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from backend.scraper.config import RANKINGS_URLS
+from backend.scraper.config import RANKINGS_URLS, PAGE_CONCURRENCY, RANKING_CACHE_TTL
 from backend.scraper.schemas import RANKINGS_SCHEMA, PLAYERS_SCHEMA
-from backend.scraper.http_utils import playwright_session
+from backend.scraper.http_utils import browser_context, throttle
+from backend.scraper.player_utils import PLAYER_ID_PATTERN
+from backend.scraper.page_cache import get_cached, put_cached
 
 logger = logging.getLogger(__name__)
 
 
-def _parse_int(text: str | None) -> int | None:
-    """Parse integer from scraped text, handling commas, +/-, '-', and 'T' prefix."""
-    if not text:
-        return None
-    text = text.strip().replace(",", "").replace("T", "")
-    if not text or text == "-":
-        return None
-    return int(text) if text.lstrip("-+").isdigit() else None
-
-
 def get_ranking_dates(ranking_type: str, context=None) -> list[str]:
     """Extract all available ranking dates from dropdown."""
     url = f"{RANKINGS_URLS[ranking_type]}?rankRange=0-5000"
@@ -29,6 +24,7 @@ def get_ranking_dates(ranking_type: str, context=None) -> list[str]:
     def _fetch(ctx):
         page = ctx.new_page()
         try:
+            throttle()
             page.goto(url, wait_until="commit", timeout=20000)
             page.wait_for_selector(
                 "select#dateWeek-filter option", state="attached", timeout=20000
@@ -42,11 +38,8 @@ def get_ranking_dates(ranking_type: str, context=None) -> list[str]:
             page.close()
 
     try:
-        if context is not None:
-            options = _fetch(context)
-        else:
-            with playwright_session() as ctx:
-                options = _fetch(ctx)
+        with browser_context(context) as ctx:
+            options = _fetch(ctx)
     except PlaywrightTimeoutError:
         logger.warning(f"Timeout fetching ranking dates for {ranking_type}")
         return []
@@ -70,6 +63,110 @@ def get_ranking_dates(ranking_type: str, context=None) -> list[str]:
     return dates
 
 
+_ROWS_SELECTOR = "table.desktop-table tbody tr.lower-row"
+
+# Returns one array per field (column-oriented) so Polars can parse whole columns
+_ROWS_SCRIPT = """
+    () => {
+        const rows = Array.from(
+            document.querySelectorAll("table.desktop-table tbody tr.lower-row")
+        );
+        // One walk per row: first descendant per class, as querySelector(".cls") would pick
+        const cells = rows.map(row => {
+            const byClass = {};
+            for (const el of row.querySelectorAll("[class]")) {
+                for (const cls of el.classList) {
+                    if (!(cls in byClass)) byClass[cls] = el;
+                }
+            }
+            return byClass;
+        });
+        const text = cls => cells.map(c => c[cls]?.textContent.trim() ?? null);
+        const links = cells.map(c => c.player?.querySelector("a") ?? null);
+        return {
+            rank:        text("rank"),
+            player_href: links.map(a => a?.href ?? null),
+            player_name: links.map(a => a?.querySelector("span")?.textContent.trim() || null),
+            points:      text("points"),
+            points_move: text("pointsMove"),
+            tourns:      text("tourns"),
+            drop:        text("drop"),
+            best:        text("best"),
+        };
+    }
+"""
+
+
+# Scraped column -> RANKINGS_SCHEMA integer column
+_INT_COLUMNS = {
+    "points": "points",
+    "points_move": "points_move",
+    "tourns": "tournaments_played",
+    "drop": "dropping",
+    "best": "next_best",
+}
+
+
+def _parse_int_expr(column: str) -> pl.Expr:
+    """Parse integers from scraped text, handling commas, whitespace, +/-, '-', and 'T' prefix."""
+    # Strip separators in one pass; anything left that isn't an integer ('-', '') casts to null
+    return pl.col(column).str.replace_all(r"[,T\s]", "").cast(pl.Int64, strict=False)
+
+
+def _ranking_url(ranking_type: str, date: str) -> str:
+    """Rankings page URL for one week."""
+    return f"{RANKINGS_URLS[ranking_type]}?rankRange=0-5000&dateWeek={date}"
+
+
+def _empty_frames() -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Empty (rankings_df, players_df) returned when a week fails."""
+    return pl.DataFrame(schema=RANKINGS_SCHEMA), pl.DataFrame(schema=PLAYERS_SCHEMA)
+
+
+def _read_rows(page, ranking_type: str, date: str) -> dict[str, list] | None:
+    """Wait for a loaded rankings page and extract its columns (None on failure)."""
+    try:
+        page.wait_for_selector(_ROWS_SELECTOR, state="attached", timeout=20000)
+        return page.evaluate(_ROWS_SCRIPT)
+    except PlaywrightTimeoutError:
+        logger.warning(f"Timeout scraping {ranking_type} rankings for {date}")
+    except Exception as e:
+        logger.warning(f"Skipping {date} due to error: {e}")
+    return None
+
+
+def _build_frames(
+    columns: dict[str, list] | None, ranking_type: str, date: str
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Convert scraped columns into (rankings_df, players_df)."""
+    if not columns or not columns["rank"]:
+        if columns is not None:
+            logger.warning(f"No ranking rows found for {date}")
+        return _empty_frames()
+
+    raw = pl.DataFrame(columns, schema={name: pl.String for name in columns}).with_columns(
+        pl.col("player_href").str.extract(PLAYER_ID_PATTERN, 1).alias("player_id")
+    )
+
+    rankings_df = raw.select(
+        _parse_int_expr("rank").alias("rank"),
+        pl.col("player_id"),
+        *[_parse_int_expr(src).alias(dst) for src, dst in _INT_COLUMNS.items()],
+        pl.lit(date).alias("date"),
+        pl.lit(ranking_type).alias("type"),
+    ).select(list(RANKINGS_SCHEMA))
+
+    players_df = raw.filter(
+        pl.col("player_id").is_not_null() & pl.col("player_name").is_not_null()
+    ).select(
+        pl.col(name) if name in raw.columns else pl.lit(None, dtype=dtype).alias(name)
+        for name, dtype in PLAYERS_SCHEMA.items()
+    )
+
+    logger.info(f"Scraped {len(rankings_df)} rows for {ranking_type} {date}")
+    return rankings_df, players_df
+
+
 def scrape_ranking(ranking_type: str, date: str, context=None) -> tuple[pl.DataFrame, pl.DataFrame]:
     """
     Scrape rankings for a specific date.
@@ -81,74 +178,74 @@ def scrape_ranking(ranking_type: str, date: str, context=None) -> tuple[pl.DataF
     Returns:
         Tuple of (rankings_df, players_df). Returns empty DataFrames on failure.
     """
-    url = f"{RANKINGS_URLS[ranking_type]}?rankRange=0-5000&dateWeek={date}"
+    results = list(scrape_rankings(ranking_type, [date], context=context))
+    if not results:
+        return _empty_frames()
+    _, rankings_df, players_df = results[0]
+    return rankings_df, players_df
+
+
+def scrape_rankings(
+    ranking_type: str,
+    dates: list[str],
+    context=None,
+    concurrency: int = PAGE_CONCURRENCY
+) -> Iterator[tuple[str, pl.DataFrame, pl.DataFrame]]:
+    """
+    Scrape rankings for several dates, keeping up to `concurrency` pages loading at once.
 
-    def _fetch(ctx):
-        page = ctx.new_page()
-        try:
-            page.goto(url, wait_until="commit", timeout=20000)
-            page.wait_for_selector(
-                "table.desktop-table tbody tr.lower-row", state="attached", timeout=20000
-            )
-            return page.evaluate("""
-                () => Array.from(
-                    document.querySelectorAll("table.desktop-table tbody tr.lower-row")
-                ).map(row => ({
-                    rank:        row.querySelector(".rank")?.textContent.trim(),
-                    player_id:   row.querySelector(".player a")?.href.split("/").slice(-2)[0],
-                    player_name: row.querySelector(".player a span")?.textContent.trim(),
-                    points:      row.querySelector(".points")?.textContent.trim(),
-                    points_move: row.querySelector(".pointsMove")?.textContent.trim(),
-                    tourns:      row.querySelector(".tourns")?.textContent.trim(),
-                    drop:        row.querySelector(".drop")?.textContent.trim(),
-                    best:        row.querySelector(".best")?.textContent.trim(),
-                }))
-            """)
-        finally:
-            page.close()
+    Navigation only waits for the response to commit, so while one page is
+    being read the next ones keep loading in the browser. Weeks read within
+    RANKING_CACHE_TTL come from the page cache without loading a page.
+
+    Args:
+        ranking_type: 'singles' or 'doubles'
+        dates: Date strings (YYYY-MM-DD format)
+        context: Existing browser context to reuse (opens one if None)
+        concurrency: Maximum number of pages in flight
 
+    Yields:
+        (date, rankings_df, players_df) in input order; empty DataFrames on failure
+    """
     try:
-        if context is not None:
-            rows = _fetch(context)
-        else:
-            with playwright_session() as ctx:
-                rows = _fetch(ctx)
-    except PlaywrightTimeoutError:
-        logger.warning(f"Timeout scraping {ranking_type} rankings for {date}")
-        return pl.DataFrame(schema=RANKINGS_SCHEMA), pl.DataFrame(schema=PLAYERS_SCHEMA)
+        with browser_context(context) as ctx:
+            # (date, loading page or None, rows if already known)
+            in_flight: deque[tuple[str, object, dict | None]] = deque()
+            pending = iter(dates)
+
+            def _open_next() -> bool:
+                date = next(pending, None)
+                if date is None:
+                    return False
+                url = _ranking_url(ranking_type, date)
+                cached = get_cached(url, RANKING_CACHE_TTL)
+                if cached is not None:
+                    in_flight.append((date, None, cached))
+                    return True
+                page = ctx.new_page()
+                try:
+                    throttle()
+                    page.goto(url, wait_until="commit", timeout=20000)
+                except Exception as e:
+                    logger.warning(f"Skipping {date} due to error: {e}")
+                    page.close()
+                    page = None
+                in_flight.append((date, page, None))
+                return True
+
+            while len(in_flight) < concurrency and _open_next():
+                pass
+
+            while in_flight:
+                date, page, rows = in_flight.popleft()
+                if page is not None:
+                    try:
+                        rows = _read_rows(page, ranking_type, date)
+                    finally:
+                        page.close()
+                    if rows and rows["rank"]:
+                        put_cached(_ranking_url(ranking_type, date), rows)
+                _open_next()
+                yield (date, *_build_frames(rows, ranking_type, date))
     except Exception as e:
-        logger.warning(f"Skipping {date} due to error: {e}")
-        return pl.DataFrame(schema=RANKINGS_SCHEMA), pl.DataFrame(schema=PLAYERS_SCHEMA)
-
-    if not rows:
-        logger.warning(f"No ranking rows found for {date}")
-        return pl.DataFrame(schema=RANKINGS_SCHEMA), pl.DataFrame(schema=PLAYERS_SCHEMA)
-
-    rankings_data = []
-    players_data = []
-
-    for row in rows:
-        rank_text = (row.get("rank") or "").replace("T", "")
-        player_id = row.get("player_id") or None
-        player_name = row.get("player_name") or None
-
-        rankings_data.append({
-            "rank":                int(rank_text) if rank_text.isdigit() else None,
-            "player_id":           player_id,
-            "points":              _parse_int(row.get("points")),
-            "points_move":         _parse_int(row.get("points_move")),
-            "tournaments_played":  _parse_int(row.get("tourns")),
-            "dropping":            _parse_int(row.get("drop")),
-            "next_best":           _parse_int(row.get("best")),
-            "date":                date,
-            "type":                ranking_type,
-        })
-
-        if player_id and player_name:
-            players_data.append({"player_id": player_id, "player_name": player_name})
-
-    logger.info(f"Scraped {len(rankings_data)} rows for {ranking_type} {date}")
-    return (
-        pl.DataFrame(rankings_data, schema=RANKINGS_SCHEMA),
-        pl.DataFrame(players_data, schema=PLAYERS_SCHEMA),
-    )
\ No newline at end of file
+        logger.warning(f"Could not scrape {ranking_type} rankings: {e}")
@@ -3,111 +3,191 @@
 
 import logging
 import re
+from collections import deque
+from typing import Iterator
+
 import polars as pl
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from backend.scraper.config import VALID_TOURNAMENT_TYPES, MONTH_MAP, RESULTS_ARCHIVE_URL
+from backend.scraper.config import (
+    VALID_TOURNAMENT_TYPES, MONTH_MAP, RESULTS_ARCHIVE_URL, PAGE_CONCURRENCY
+)
 from backend.scraper.schemas import TOURNAMENTS_SCHEMA
-from backend.scraper.http_utils import playwright_session
+from backend.scraper.http_utils import browser_context, throttle
 from backend.scraper.player_utils import extract_player_id
 
 logger = logging.getLogger(__name__)
 
+# "19 - 25 February, 2024"
+_DATE_RANGE_SAME_MONTH_RE = re.compile(r'(\d+)\s*-\s*(\d+)\s+([A-Za-z]+),?\s+(\d{4})')
+# "28 February - 3 March, 2024"
+_DATE_RANGE_SAME_YEAR_RE = re.compile(r'(\d+)\s+([A-Za-z]+)\s*-\s*(\d+)\s+([A-Za-z]+),?\s+(\d{4})')
+# "30 December, 2023 - 6 January, 2024"
+_DATE_RANGE_CROSS_YEAR_RE = re.compile(
+    r'(\d+)\s+([A-Za-z]+),?\s+(\d{4})\s*-\s*(\d+)\s+([A-Za-z]+),?\s+(\d{4})'
+)
+
 
 def _parse_date_range(date_str: str) -> tuple[str | None, str | None]:
     """Parse tournament date range into start/end dates."""
     if not date_str:
         return None, None
     date_str = " ".join(date_str.split())
-    if m := re.match(r'(\d+)\s*-\s*(\d+)\s+([A-Za-z]+),?\s+(\d{4})', date_str):
+    if m := _DATE_RANGE_SAME_MONTH_RE.match(date_str):
         start_day, end_day, month, year = m.groups()
         month_num = MONTH_MAP.get(month, '01')
         return f"{year}-{month_num}-{start_day.zfill(2)}", f"{year}-{month_num}-{end_day.zfill(2)}"
-    if m := re.match(r'(\d+)\s+([A-Za-z]+)\s*-\s*(\d+)\s+([A-Za-z]+),?\s+(\d{4})', date_str):
+    if m := _DATE_RANGE_SAME_YEAR_RE.match(date_str):
         sd, sm, ed, em, year = m.groups()
         return f"{year}-{MONTH_MAP.get(sm,'01')}-{sd.zfill(2)}", f"{year}-{MONTH_MAP.get(em,'01')}-{ed.zfill(2)}"
-    if m := re.match(r'(\d+)\s+([A-Za-z]+),?\s+(\d{4})\s*-\s*(\d+)\s+([A-Za-z]+),?\s+(\d{4})', date_str):
+    if m := _DATE_RANGE_CROSS_YEAR_RE.match(date_str):
         sd, sm, sy, ed, em, ey = m.groups()
         return f"{sy}-{MONTH_MAP.get(sm,'01')}-{sd.zfill(2)}", f"{ey}-{MONTH_MAP.get(em,'01')}-{ed.zfill(2)}"
     return None, None
 
 
-def scrape_tournaments(year: int, tournament_type: str = "atp", context=None) -> pl.DataFrame:
-    """Scrape tournaments for a specific year and type using Playwright."""
-    if tournament_type not in VALID_TOURNAMENT_TYPES:
-        raise ValueError(f"Invalid tournament type: {tournament_type}. Must be one of {VALID_TOURNAMENT_TYPES}")
-
-    url = f"{RESULTS_ARCHIVE_URL}?year={year}&tournamentType={tournament_type}"
-
-    def _fetch(ctx):
-        page = ctx.new_page()
-        try:
-            page.goto(url, wait_until="commit", timeout=20000)
-            page.wait_for_selector("ul.events li", state="attached", timeout=20000)
-            return page.evaluate("""
-                () => Array.from(document.querySelectorAll("ul.events li")).map(li => {
-                    const info = li.querySelector(".tournament-info");
-                    if (!info) return null;
-                    const flagUse = info.querySelector("svg.atp-flag use");
-                    const flagHref = flagUse?.getAttribute("href") || "";
-                    const flagMatch = flagHref.match(/#flag-([a-z]+)/);
-                    const winners = {};
-                    li.querySelectorAll(".cta-holder dl.winner").forEach(dl => {
-                        const label = dl.querySelector("dt")?.textContent || "";
-                        const links = Array.from(dl.querySelectorAll("a"));
-                        if (label.includes("Singles") && links[0]) {
-                            winners.singles_name = links[0].textContent.trim();
-                            winners.singles_href = links[0].href;
-                        } else if (label.includes("Doubles")) {
-                            winners.doubles_names = links.map(a => a.textContent.trim());
-                            winners.doubles_hrefs = links.map(a => a.href);
-                        }
-                    });
-                    return {
-                        name: info.querySelector(".name")?.textContent.trim(),
-                        venue: info.querySelector(".venue")?.textContent.trim().replace(/\\s*\\|\\s*$/, ""),
-                        date_str: info.querySelector(".Date")?.textContent.trim(),
-                        country_code: flagMatch ? flagMatch[1].toUpperCase() : null,
-                        ...winners,
-                    };
-                }).filter(Boolean)
-            """)
-        finally:
-            page.close()
+def _tournaments_url(year: int, tournament_type: str) -> str:
+    """Results archive URL for one year and tournament type."""
+    return f"{RESULTS_ARCHIVE_URL}?year={year}&tournamentType={tournament_type}"
+
+
+_ROWS_SELECTOR = "ul.events li"
+
+_ROWS_SCRIPT = """
+    () => Array.from(document.querySelectorAll("ul.events li")).map(li => {
+        const info = li.querySelector(".tournament-info");
+        if (!info) return null;
+        const flagUse = info.querySelector("svg.atp-flag use");
+        const flagHref = flagUse?.getAttribute("href") || "";
+        const flagMatch = flagHref.match(/#flag-([a-z]+)/);
+        const winners = {};
+        li.querySelectorAll(".cta-holder dl.winner").forEach(dl => {
+            const label = dl.querySelector("dt")?.textContent || "";
+            const links = Array.from(dl.querySelectorAll("a"));
+            if (label.includes("Singles") && links[0]) {
+                winners.singles_name = links[0].textContent.trim();
+                winners.singles_href = links[0].href;
+            } else if (label.includes("Doubles")) {
+                winners.doubles_names = links.map(a => a.textContent.trim());
+                winners.doubles_hrefs = links.map(a => a.href);
+            }
+        });
+        return {
+            name: info.querySelector(".name")?.textContent.trim(),
+            venue: info.querySelector(".venue")?.textContent.trim().replace(/\\s*\\|\\s*$/, ""),
+            date_str: info.querySelector(".Date")?.textContent.trim(),
+            country_code: flagMatch ? flagMatch[1].toUpperCase() : null,
+            ...winners,
+        };
+    }).filter(Boolean)
+"""
 
+
+def _read_rows(page, year: int, tournament_type: str) -> list[dict] | None:
+    """Wait for a loaded results archive page and extract its rows (None on failure)."""
     try:
-        rows = _fetch(context) if context else None
-        if rows is None:
-            with playwright_session() as ctx:
-                rows = _fetch(ctx)
+        page.wait_for_selector(_ROWS_SELECTOR, state="attached", timeout=20000)
+        return page.evaluate(_ROWS_SCRIPT)
     except PlaywrightTimeoutError:
         logger.warning(f"Timeout scraping {tournament_type} {year}")
-        return pl.DataFrame(schema=TOURNAMENTS_SCHEMA)
     except Exception as e:
         logger.warning(f"Skipping {tournament_type} {year}: {e}")
+    return None
+
+
+def _build_frame(rows: list[dict] | None, year: int, tournament_type: str) -> pl.DataFrame:
+    """Convert scraped rows into a TOURNAMENTS_SCHEMA frame."""
+    # skip incomplete tournaments
+    rows = [
+        row for row in rows or []
+        if extract_player_id(row.get("singles_href")) or row.get("doubles_hrefs")
+    ]
+    dates = [_parse_date_range(row.get("date_str")) for row in rows]
+
+    return pl.DataFrame({
+        "year": [year] * len(rows),
+        "tournament_type": [tournament_type] * len(rows),
+        "tournament_name": [row.get("name") for row in rows],
+        "venue": [row.get("venue") for row in rows],
+        "country_code": [row.get("country_code") for row in rows],
+        "start_date": [start for start, _ in dates],
+        "end_date": [end for _, end in dates],
+        "singles_winner_id": [extract_player_id(row.get("singles_href")) for row in rows],
+        "singles_winner_name": [row.get("singles_name") for row in rows],
+        "doubles_winner_ids": [
+            ",".join(pid for h in row.get("doubles_hrefs") or [] if (pid := extract_player_id(h)))
+            or None
+            for row in rows
+        ],
+        "doubles_winner_names": [",".join(row.get("doubles_names") or []) or None for row in rows],
+    }, schema=TOURNAMENTS_SCHEMA)
+
+
+def scrape_tournaments(year: int, tournament_type: str = "atp", context=None) -> pl.DataFrame:
+    """Scrape tournaments for a specific year and type using Playwright."""
+    results = list(scrape_tournaments_batch([(year, tournament_type)], context=context))
+    if not results:
         return pl.DataFrame(schema=TOURNAMENTS_SCHEMA)
+    return results[0][2]
+
+
+def scrape_tournaments_batch(
+    jobs: list[tuple[int, str]],
+    context=None,
+    concurrency: int = PAGE_CONCURRENCY
+) -> Iterator[tuple[int, str, pl.DataFrame]]:
+    """
+    Scrape several (year, tournament_type) archives, keeping up to `concurrency` pages loading at once.
+
+    Like scrape_rankings, navigation only waits for the response to commit,
+    so the next archives keep loading while one is being read.
+
+    Args:
+        jobs: (year, tournament_type) pairs
+        context: Existing browser context to reuse (opens one if None)
+        concurrency: Maximum number of pages in flight
 
-    data = []
-    for row in rows:
-        singles_id = extract_player_id(row.get("singles_href"))
-        # skip incomplete tournaments
-        if not singles_id and not row.get("doubles_hrefs"):
-            continue
-        doubles_hrefs = row.get("doubles_hrefs") or []
-        doubles_ids = [pid for h in doubles_hrefs if (pid := extract_player_id(h))]
-        start_date, end_date = _parse_date_range(row.get("date_str"))
-        data.append({
-            "year": year,
-            "tournament_type": tournament_type,
-            "tournament_name": row.get("name"),
-            "venue": row.get("venue"),
-            "country_code": row.get("country_code"),
-            "start_date": start_date,
-            "end_date": end_date,
-            "singles_winner_id": singles_id,
-            "singles_winner_name": row.get("singles_name"),
-            "doubles_winner_ids": ",".join(doubles_ids) or None,
-            "doubles_winner_names": ",".join(row.get("doubles_names") or []) or None,
-        })
-
-    return pl.DataFrame(data, schema=TOURNAMENTS_SCHEMA)
\ No newline at end of file
+    Yields:
+        (year, tournament_type, df) in input order; empty DataFrame on failure
+    """
+    for _, tournament_type in jobs:
+        if tournament_type not in VALID_TOURNAMENT_TYPES:
+            raise ValueError(f"Invalid tournament type: {tournament_type}. Must be one of {VALID_TOURNAMENT_TYPES}")
+
+    try:
+        with browser_context(context) as ctx:
+            in_flight: deque[tuple[int, str, object]] = deque()
+            pending = iter(jobs)
+
+            def _open_next() -> bool:
+                job = next(pending, None)
+                if job is None:
+                    return False
+                year, tournament_type = job
+                logger.info(f"Scraping {tournament_type} {year}...")
+                page = ctx.new_page()
+                try:
+                    throttle()
+                    page.goto(_tournaments_url(year, tournament_type), wait_until="commit", timeout=20000)
+                except Exception as e:
+                    logger.warning(f"Skipping {tournament_type} {year}: {e}")
+                    page.close()
+                    page = None
+                in_flight.append((year, tournament_type, page))
+                return True
+
+            while len(in_flight) < concurrency and _open_next():
+                pass
+
+            while in_flight:
+                year, tournament_type, page = in_flight.popleft()
+                rows = None
+                if page is not None:
+                    try:
+                        rows = _read_rows(page, year, tournament_type)
+                    finally:
+                        page.close()
+                _open_next()
+                yield year, tournament_type, _build_frame(rows, year, tournament_type)
+    except Exception as e:
+        logger.warning(f"Could not scrape tournaments: {e}")
@@ -1,65 +1,81 @@
 # backend/scraper/updater.py
 """Update logic for rankings and player biographical data."""
 
+import heapq
 import logging
+import threading
 import polars as pl
 
-from backend.scraper.ranking_scraper import get_ranking_dates, scrape_ranking
-from backend.scraper.http_utils import playwright_session
+from backend.scraper.ranking_scraper import get_ranking_dates, scrape_rankings
+from backend.scraper.http_utils import browser_context
 from backend.scraper.player_scraper import scrape_players_batch
 from backend.scraper.config import BIO_COLUMNS
-from backend.scraper.schemas import RANKINGS_SCHEMA, PLAYERS_SCHEMA
+from backend.scraper.schemas import PLAYERS_SCHEMA
 from backend.scraper.player_utils import generate_player_slug
 from backend.storage.s3_data_store import (
-    load_rankings, save_rankings,
-    load_players, save_players,
-    upsert_data
+    upsert_rankings, scan_rankings,
+    load_players, save_players, scan_players
 )
 
 logger = logging.getLogger(__name__)
 
+# Singles and doubles updates may run concurrently; both rewrite the players table
+_players_lock = threading.Lock()
+
 
 def _ensure_schema_columns(df: pl.DataFrame, schema: dict) -> pl.DataFrame:
     """Ensure DataFrame has all schema columns with null values for missing ones."""
-    for col, dtype in schema.items():
-        if col not in df.columns:
-            df = df.with_columns(pl.lit(None).cast(dtype).alias(col))
-    return df.select(list(schema.keys()))
+    if df.is_empty():
+        return pl.DataFrame(schema=schema)
+    return df.select(
+        pl.col(col) if col in df.columns else pl.lit(None, dtype=dtype).alias(col)
+        for col, dtype in schema.items()
+    )
 
 
-def update_rankings(ranking_type: str, max_weeks: int | None = None) -> int:
+def update_rankings(ranking_type: str, max_weeks: int | None = None, context=None) -> int:
     """
     Scrape missing rankings.
 
     Args:
         ranking_type: 'singles' or 'doubles'
         max_weeks: Maximum number of weeks to scrape (None = all missing)
+        context: Existing browser context to reuse (opens one if None)
 
     Returns:
         Number of weeks successfully scraped
     """
     # Single browser session for all ranking fetches — avoids re-launching Chromium
-    with playwright_session() as ctx:
+    with browser_context(context) as ctx:
         all_dates = get_ranking_dates(ranking_type, context=ctx)
 
-        existing = load_rankings(ranking_type, schema=RANKINGS_SCHEMA)
-        scraped_dates = set(existing["date"].unique())
+        # Only the date column is needed here; the full history is loaded at save time
+        try:
+            scraped_dates = set(
+                scan_rankings(ranking_type).select(pl.col("date").unique()).collect()["date"]
+            )
+        except FileNotFoundError:
+            scraped_dates = set()
 
-        missing = sorted([d for d in all_dates if d not in scraped_dates], reverse=True)
+        missing = [d for d in all_dates if d not in scraped_dates]
 
         if not missing:
             logger.info(f"No missing {ranking_type} rankings to scrape")
             return 0
 
-        dates_to_scrape = missing[:max_weeks] if max_weeks else missing
+        # Newest weeks first; only the requested number needs ordering
+        if max_weeks:
+            dates_to_scrape = heapq.nlargest(max_weeks, missing)
+        else:
+            dates_to_scrape = sorted(missing, reverse=True)
         logger.info(f"Scraping {len(dates_to_scrape)} weeks for {ranking_type}...")
 
         ranking_frames = []
         player_frames = []
 
-        for i, date in enumerate(dates_to_scrape, 1):
+        weeks = scrape_rankings(ranking_type, dates_to_scrape, context=ctx)
+        for i, (date, rankings_df, players_df) in enumerate(weeks, 1):
             logger.info(f"  {i}/{len(dates_to_scrape)}: {date}")
-            rankings_df, players_df = scrape_ranking(ranking_type, date, context=ctx)
 
             if len(rankings_df) > 0:
                 ranking_frames.append(rankings_df)
@@ -77,70 +93,68 @@ def update_rankings(ranking_type: str, max_weeks: int | None = None) -> int:
         if player_frames else pl.DataFrame(schema=PLAYERS_SCHEMA)
     )
 
-    combined_rankings = pl.concat([existing, new_rankings])
-    save_rankings(combined_rankings, ranking_type)
-
-    existing_players = load_players(schema=PLAYERS_SCHEMA)
-    new_players = _ensure_schema_columns(new_players, PLAYERS_SCHEMA)
-    existing_players = _ensure_schema_columns(existing_players, PLAYERS_SCHEMA)
+    # Only the year partitions the new weeks fall in are read and rewritten
+    upsert_rankings(new_rankings, ranking_type)
+
+    with _players_lock:
+        new_players = _ensure_schema_columns(new_players, PLAYERS_SCHEMA)
+
+        # Only the id column is read to find new players, and the table is
+        # rewritten only when there are some
+        try:
+            truly_new = new_players.lazy().join(
+                scan_players().select("player_id"), on="player_id", how="anti"
+            ).collect()
+        except FileNotFoundError:
+            truly_new = new_players
+
+        if len(truly_new) > 0:
+            existing_players = _ensure_schema_columns(
+                load_players(schema=PLAYERS_SCHEMA), PLAYERS_SCHEMA
+            )
+            save_players(pl.concat([existing_players, truly_new]))
+            logger.info(f"Adding {len(truly_new)} new players to players table")
+        else:
+            logger.info("No new players to add")
+    logger.info(f"Successfully scraped {len(ranking_frames)} weeks")
+    return len(ranking_frames)
 
-    existing_ids = set(existing_players["player_id"].to_list())
-    truly_new = new_players.filter(~pl.col("player_id").is_in(existing_ids))
 
-    if len(truly_new) > 0:
-        combined_players = pl.concat([existing_players, truly_new])
-        logger.info(f"Adding {len(truly_new)} new players to players table")
-    else:
-        combined_players = existing_players
-        logger.info("No new players to add")
+def _best_ranks(ranking_type: str) -> pl.DataFrame:
+    """Each player's best rank and the date first reached, as best_{type}_rank/_date."""
+    try:
+        lf = scan_rankings(ranking_type)
+    except FileNotFoundError:
+        return pl.DataFrame(schema={
+            "player_id": pl.String,
+            f"best_{ranking_type}_rank": pl.Int64,
+            f"best_{ranking_type}_date": pl.String
+        })
 
-    save_players(combined_players)
-    logger.info(f"Successfully scraped {len(ranking_frames)} weeks")
-    return len(ranking_frames)
+    # Only three columns are read, and no global sort is needed to find the date
+    return lf.select("player_id", "rank", "date").group_by("player_id").agg(
+        pl.col("rank").min().alias(f"best_{ranking_type}_rank"),
+        pl.col("date").filter(pl.col("rank") == pl.col("rank").min()).min()
+        .alias(f"best_{ranking_type}_date")
+    ).collect(engine="streaming")
 
 
-def update_player_bio(num_players: int = 10) -> int:
+def update_player_bio(num_players: int = 10, context=None) -> int:
     """
     Scrape biographical data for players missing info.
 
     Args:
         num_players: Number of top players to scrape
+        context: Existing browser context to reuse (opens one if None)
 
     Returns:
         Number of players successfully scraped
     """
     players_df = load_players(schema=PLAYERS_SCHEMA)
 
-    # Load rankings to determine priority
-    singles_df = load_rankings("singles", schema=RANKINGS_SCHEMA)
-    doubles_df = load_rankings("doubles", schema=RANKINGS_SCHEMA)
-
-    # Get best ranks (only if data exists)
-    best_singles = (
-        singles_df.sort("rank").group_by("player_id").agg([
-            pl.col("rank").min().alias("best_singles_rank"),
-            pl.col("date").first().alias("best_singles_date")
-        ])
-        if len(singles_df) > 0
-        else pl.DataFrame(schema={
-            "player_id": pl.String,
-            "best_singles_rank": pl.Int64,
-            "best_singles_date": pl.String
-        })
-    )
-
-    best_doubles = (
-        doubles_df.sort("rank").group_by("player_id").agg([
-            pl.col("rank").min().alias("best_doubles_rank"),
-            pl.col("date").first().alias("best_doubles_date")
-        ])
-        if len(doubles_df) > 0
-        else pl.DataFrame(schema={
-            "player_id": pl.String,
-            "best_doubles_rank": pl.Int64,
-            "best_doubles_date": pl.String
-        })
-    )
+    # Best ranks determine priority
+    best_singles = _best_ranks("singles")
+    best_doubles = _best_ranks("doubles")
 
     # Enrich with rankings
     enriched = (
@@ -183,7 +197,7 @@ def update_player_bio(num_players: int = 10) -> int:
         player_name_map[pid] = name
 
     # Use shared browser session
-    batch_results = scrape_players_batch(players_to_scrape)
+    batch_results = scrape_players_batch(players_to_scrape, context=context)
 
     # Collect updates
     updates: list[dict] = []
@@ -201,19 +215,17 @@ def update_player_bio(num_players: int = 10) -> int:
     updates_df = pl.DataFrame(updates)
     updates_df = _ensure_schema_columns(updates_df, PLAYERS_SCHEMA)
 
-    # ✅ FIX: Merge using selective update - only update NULL bio fields
-    # Get the subset of columns that were actually scraped (bio fields only)
-    bio_field_updates = {row['player_id']: row for row in updates}
-
-    # Update players_df by filling in bio fields without overwriting names
-    for player_id, update_data in bio_field_updates.items():
-        players_df = players_df.with_columns([
-            pl.when(pl.col("player_id") == player_id)
-            .then(pl.lit(update_data.get(col)))
-            .otherwise(pl.col(col))
-            .alias(col)
-            for col in BIO_COLUMNS if col in update_data
-        ])
+    # Fill in bio fields in one join, without touching names; a field the
+    # scrape did not find keeps its existing value
+    players_df = (
+        players_df
+        .join(
+            updates_df.select(["player_id", *BIO_COLUMNS]).unique(subset="player_id", keep="last"),
+            on="player_id", how="left", suffix="_new"
+        )
+        .with_columns([pl.coalesce(f"{col}_new", col).alias(col) for col in BIO_COLUMNS])
+        .drop([f"{col}_new" for col in BIO_COLUMNS])
+    )
 
     save_players(players_df)
     logger.info(f"Successfully updated {len(updates)} players")
@@ -3,12 +3,18 @@
 
 import polars as pl
 import boto3
+from boto3.s3.transfer import TransferConfig
 import os
+import json
 from pathlib import Path
 from io import BytesIO
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from botocore.client import BaseClient
-from typing import Optional
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from typing import Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +24,32 @@ USE_S3 = os.getenv("USE_S3", "true").lower() == "true"
 LOCAL_DATA_DIR = Path("data")
 LOCAL_DATA_DIR.mkdir(exist_ok=True)
 
-# Initialize S3 client (only if using S3)
-s3_client: Optional[BaseClient] = boto3.client("s3") if USE_S3 else None
+# Initialize S3 client (only if using S3); one client is shared by all threads,
+# with a pool large enough for concurrent requests and keep-alive connections
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    s3={"addressing_style": "virtual"}
+)
+s3_client: Optional[BaseClient] = boto3.client("s3", config=S3_CLIENT_CONFIG) if USE_S3 else None
+
+# Row groups small enough for readers to parallelize over, with statistics
+# so filters on sorted columns can skip them
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "row_group_size": 128_000,
+    "statistics": True,
+}
+
+# Multipart uploads in 8 MiB parts, sent concurrently
+UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
 
 
 def _get_s3_key(filename: str) -> str:
@@ -27,53 +57,124 @@ def _get_s3_key(filename: str) -> str:
     return f"data/{filename}"
 
 
-def save_data(df: pl.DataFrame, filename: str) -> None:
+def _write_parquet(df: pl.DataFrame | pl.LazyFrame, target) -> pl.DataFrame:
+    """
+    Write a frame to a parquet path or buffer, returning the collected frame.
+
+    Lazy frames are collected first rather than sent through sink_parquet,
+    whose single-threaded writer is much slower for frames of this size.
+    """
+    if isinstance(df, pl.LazyFrame):
+        df = df.collect()
+    df.write_parquet(target, **PARQUET_WRITE_OPTIONS)
+    return df
+
+
+def save_data(df: pl.DataFrame | pl.LazyFrame, filename: str) -> None:
     """Save DataFrame to parquet (S3 or local)."""
     if USE_S3:
         assert s3_client is not None
 
         # Write to bytes buffer
         buffer = BytesIO()
-        df.write_parquet(buffer)
+        df = _write_parquet(df, buffer)
+        size = buffer.tell()
         buffer.seek(0)
 
-        # Upload to S3
+        # Upload to S3 straight from the buffer, in parts for large files
         s3_key = _get_s3_key(filename)
-        s3_client.put_object(
-            Bucket=BUCKET_NAME,
-            Key=s3_key,
-            Body=buffer.getvalue(),
-            ContentType="application/octet-stream"
+        s3_client.upload_fileobj(
+            buffer,
+            BUCKET_NAME,
+            s3_key,
+            ExtraArgs={"ContentType": "application/octet-stream"},
+            Config=UPLOAD_CONFIG
         )
         logger.info(f"Saved {filename} to S3: s3://{BUCKET_NAME}/{s3_key}")
     else:
         # Save locally
         path = LOCAL_DATA_DIR / filename
-        df.write_parquet(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df = _write_parquet(df, path)
         logger.info(f"Saved {filename} locally: {path}")
+        size = path.stat().st_size
 
+    _save_stats(df, filename, size)
 
-def load_data(filename: str) -> pl.DataFrame:
-    """Load DataFrame from parquet (S3 or local)."""
+
+def load_data(filename: str, columns: list[str] | None = None) -> pl.DataFrame:
+    """
+    Load DataFrame from parquet (S3 or local), optionally only some columns.
+
+    Reads through the lazy scan, so S3 objects are fetched with ranged reads of
+    the needed column chunks instead of being downloaded whole into memory.
+    """
+    # No existence check up front; a missing object surfaces when collecting
+    lf = scan_data(filename, check_exists=False)
+    if columns is not None:
+        lf = lf.select(columns)
+    df = _collect(lf, filename)
     if USE_S3:
+        logger.info(f"Loaded {filename} from S3")
+    return df
+
+
+def _scan_source(filename: str) -> str:
+    """Convert filename to a path or URI that pl.scan_parquet can read."""
+    if USE_S3:
+        return f"s3://{BUCKET_NAME}/{_get_s3_key(filename)}"
+    return str(LOCAL_DATA_DIR / filename)
+
+
+# Parquet reads go through Polars' own object store client, which resolves
+# credentials and region itself; S3_CLIENT_CONFIG does not apply to them, so
+# only the retry budget is carried over
+SCAN_STORAGE_OPTIONS = (
+    {"max_retries": S3_CLIENT_CONFIG.retries["max_attempts"]} if USE_S3 else None
+)
+
+
+def _scan(sources: str | list[str]) -> pl.LazyFrame:
+    """pl.scan_parquet with the storage options for the current backend."""
+    return pl.scan_parquet(sources, storage_options=SCAN_STORAGE_OPTIONS)
+
+
+def _collect(lf: pl.LazyFrame, filename: str) -> pl.DataFrame:
+    """Collect a scan of `filename`, raising FileNotFoundError if the object is missing."""
+    try:
+        return lf.collect()
+    except FileNotFoundError:
+        raise
+    except (OSError, pl.exceptions.ComputeError) as e:
+        message = str(e).lower()
+        if "not found" in message or "notfound" in message or "404" in message:
+            raise FileNotFoundError(_scan_source(filename)) from e
+        raise
+
+
+def scan_data(filename: str, check_exists: bool = True) -> pl.LazyFrame:
+    """
+    Lazily scan parquet (S3 or local) so filters and projections push down to the reader.
+
+    With check_exists, a missing file raises FileNotFoundError here (one HEAD
+    request on S3) rather than when the plan is collected; callers that
+    already listed the file or collect through _collect can skip it.
+    """
+    if USE_S3 and check_exists:
         assert s3_client is not None
 
         s3_key = _get_s3_key(filename)
         try:
-            # Download from S3
-            response = s3_client.get_object(Bucket=BUCKET_NAME, Key=s3_key)
-            buffer = BytesIO(response["Body"].read())
-            df = pl.read_parquet(buffer)
-            logger.info(f"Loaded {filename} from S3")
-            return df
-        except s3_client.exceptions.NoSuchKey:
-            raise FileNotFoundError(f"s3://{BUCKET_NAME}/{s3_key}")
-    else:
-        # Load locally
+            s3_client.head_object(Bucket=BUCKET_NAME, Key=s3_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                raise FileNotFoundError(f"s3://{BUCKET_NAME}/{s3_key}")
+            raise
+    elif not USE_S3:
         path = LOCAL_DATA_DIR / filename
         if not path.exists():
             raise FileNotFoundError(str(path))
-        return pl.read_parquet(path)
+    return _scan(_scan_source(filename))
 
 
 def load_data_or_empty(filename: str, schema: dict) -> pl.DataFrame:
@@ -86,25 +187,159 @@ def load_data_or_empty(filename: str, schema: dict) -> pl.DataFrame:
 
 def upsert_data(
     new_df: pl.DataFrame,
-    existing_df: pl.DataFrame,
+    existing_df: pl.DataFrame | pl.LazyFrame,
     unique_cols: list[str]
 ) -> pl.DataFrame:
-    """Combine and deduplicate data."""
-    return pl.concat([existing_df, new_df]).unique(subset=unique_cols, keep="last")
+    """
+    Combine and deduplicate data, with new rows replacing existing ones on key match.
+
+    `existing_df` may be a lazy scan; it is then streamed through the anti-join
+    instead of being loaded first.
+    """
+    new_lf = new_df.lazy().unique(subset=unique_cols, keep="last", maintain_order=True)
+    # Only existing rows without a replacement survive; new rows are appended as-is
+    kept_lf = existing_df.lazy().join(
+        new_lf.select(unique_cols), on=unique_cols, how="anti", nulls_equal=True
+    )
+    return pl.concat([kept_lf, new_lf]).collect()
+
+
+# Year-partitioned datasets: one file per year under data/{dataset}/, so
+# updates only read and rewrite the years they touch
+def _partition_filename(dataset: str, year) -> str:
+    """Filename of one year partition of a dataset."""
+    return f"{dataset}/year={year}.parquet"
+
+
+def list_partitions(dataset: str) -> list[str]:
+    """List partition filenames of a dataset, oldest year first."""
+    if USE_S3:
+        assert s3_client is not None
+
+        paginator = s3_client.get_paginator("list_objects_v2")
+        names = [
+            obj["Key"].removeprefix(_get_s3_key(""))
+            for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=_get_s3_key(f"{dataset}/"))
+            for obj in page.get("Contents", [])
+        ]
+    else:
+        names = [f"{dataset}/{p.name}" for p in (LOCAL_DATA_DIR / dataset).glob("*.parquet")]
+    return sorted(name for name in names if name.endswith(".parquet"))
+
+
+def save_partitioned(df: pl.DataFrame, dataset: str, year_expr: pl.Expr) -> None:
+    """Write each year present in df to its partition, replacing that partition."""
+    keyed = df.with_columns(year_expr.alias("_partition"))
+    for (year,), part in keyed.partition_by("_partition", as_dict=True).items():
+        save_data(part.drop("_partition"), _partition_filename(dataset, year))
+
+
+def _migrate_legacy(dataset: str, legacy_filename: str, year_expr: pl.Expr) -> None:
+    """Split a pre-partitioning single-file dataset into year partitions (once)."""
+    if list_partitions(dataset):
+        return
+    try:
+        legacy_df = load_data(legacy_filename)
+    except FileNotFoundError:
+        return
+    save_partitioned(legacy_df, dataset, year_expr)
+    logger.info(f"Migrated {legacy_filename} to year partitions under {dataset}/")
+
+
+def load_partitioned(dataset: str, legacy_filename: str) -> pl.DataFrame:
+    """
+    Load all partitions of a dataset, falling back to its legacy single file.
+
+    Goes through the single multi-file scan, so partitions are fetched in
+    parallel rather than one request after another.
+    """
+    return scan_partitioned(dataset, legacy_filename).collect()
+
+
+def scan_partitioned(dataset: str, legacy_filename: str) -> pl.LazyFrame:
+    """Lazily scan all partitions of a dataset, falling back to its legacy single file."""
+    partitions = list_partitions(dataset)
+    if not partitions:
+        return scan_data(legacy_filename)
+    return _scan([_scan_source(name) for name in partitions])
+
+
+def upsert_partitioned(
+    new_df: pl.DataFrame,
+    dataset: str,
+    legacy_filename: str,
+    year_expr: pl.Expr,
+    unique_cols: list[str],
+    sort_by: list[str] | None = None
+) -> None:
+    """
+    Upsert new rows, reading and rewriting only the partitions they fall in.
+
+    Each partition is merged and written on its own, so peak memory is one
+    year of rows. The merged year is written with PARQUET_WRITE_OPTIONS rather
+    than sunk, both because sink_parquet is slower at this size (see
+    _write_parquet) and because the merge reads the file being replaced.
+    """
+    _migrate_legacy(dataset, legacy_filename, year_expr)
+    existing = set(list_partitions(dataset))
+
+    keyed = new_df.with_columns(year_expr.alias("_partition"))
+    for (year,), part in keyed.partition_by("_partition", as_dict=True).items():
+        filename = _partition_filename(dataset, year)
+        part = part.drop("_partition")
+        if filename in existing:
+            # Known to exist from the listing above; no HEAD needed
+            part = upsert_data(part, scan_data(filename, check_exists=False), unique_cols)
+        if sort_by:
+            part = part.sort(sort_by)
+        save_data(part, filename)
 
 
 # Convenience functions for specific data types
+RANKINGS_YEAR = pl.col("date").str.slice(0, 4)
+RANKINGS_KEYS = ["date", "player_id"]
+
+
 def save_rankings(df: pl.DataFrame, ranking_type: str) -> None:
-    """Save rankings data."""
-    save_data(df, f"{ranking_type}_rankings.parquet")
+    """
+    Save rankings data, one partition per year.
+
+    Rows are sorted so row-group statistics on player_id/date stay tight.
+    """
+    save_partitioned(df.sort(["player_id", "date"]), f"{ranking_type}_rankings", RANKINGS_YEAR)
+
+
+def upsert_rankings(new_df: pl.DataFrame, ranking_type: str) -> None:
+    """
+    Merge newly scraped weeks into the year partitions they fall in.
+
+    Rows without a player_id are dropped: they cannot be keyed on
+    (date, player_id), and the upsert would otherwise collapse each week's
+    unlinked rows into one.
+    """
+    unlinked = new_df.select(pl.col("player_id").is_null().sum()).item()
+    if unlinked:
+        logger.warning(f"Dropping {unlinked} {ranking_type} ranking rows without a player_id")
+        new_df = new_df.filter(pl.col("player_id").is_not_null())
+    upsert_partitioned(
+        new_df, f"{ranking_type}_rankings", f"{ranking_type}_rankings.parquet",
+        RANKINGS_YEAR, RANKINGS_KEYS, sort_by=["player_id", "date"]
+    )
 
 
 def load_rankings(ranking_type: str, schema: dict | None = None) -> pl.DataFrame:
     """Load rankings data, optionally returning empty DataFrame with schema."""
-    filename = f"{ranking_type}_rankings.parquet"
-    if schema is not None:
-        return load_data_or_empty(filename, schema)
-    return load_data(filename)
+    try:
+        return load_partitioned(f"{ranking_type}_rankings", f"{ranking_type}_rankings.parquet")
+    except FileNotFoundError:
+        if schema is not None:
+            return pl.DataFrame(schema=schema)
+        raise
+
+
+def scan_rankings(ranking_type: str) -> pl.LazyFrame:
+    """Lazily scan rankings data; date filters prune year partitions by their statistics."""
+    return scan_partitioned(f"{ranking_type}_rankings", f"{ranking_type}_rankings.parquet")
 
 
 def load_singles_rankings(schema: dict | None = None) -> pl.DataFrame:
@@ -129,113 +364,332 @@ def load_players(schema: dict | None = None) -> pl.DataFrame:
     return load_data("players.parquet")
 
 
+def scan_players() -> pl.LazyFrame:
+    """Lazily scan players data."""
+    return scan_data("players.parquet")
+
+
+TOURNAMENTS_KEYS = ["year", "tournament_type", "tournament_name", "start_date"]
+
+
 def save_tournaments(df: pl.DataFrame) -> None:
-    """Save tournaments data."""
-    save_data(df, "tournaments.parquet")
+    """Save tournaments data, one partition per year."""
+    save_partitioned(df, "tournaments", pl.col("year"))
+
+
+def upsert_tournaments(new_df: pl.DataFrame) -> None:
+    """Merge newly scraped tournaments into the years they belong to."""
+    upsert_partitioned(
+        new_df, "tournaments", "tournaments.parquet", pl.col("year"), TOURNAMENTS_KEYS
+    )
 
 
 def load_tournaments(schema: dict | None = None) -> pl.DataFrame:
     """Load tournaments data, optionally returning empty DataFrame with schema."""
-    if schema is not None:
-        return load_data_or_empty("tournaments.parquet", schema)
-    return load_data("tournaments.parquet")
+    try:
+        return load_partitioned("tournaments", "tournaments.parquet")
+    except FileNotFoundError:
+        if schema is not None:
+            return pl.DataFrame(schema=schema)
+        raise
 
 
-def get_data_summary() -> dict:
-    """Get summary statistics for all data files."""
-    summary = {
-        "bucket": BUCKET_NAME if USE_S3 else "local",
-        "storage": "s3" if USE_S3 else "local",
-        "use_s3": USE_S3,
-    }
+def scan_tournaments() -> pl.LazyFrame:
+    """Lazily scan tournaments data."""
+    return scan_partitioned("tournaments", "tournaments.parquet")
 
-    # Singles Rankings
-    try:
-        df = load_data("singles_rankings.parquet")
-        min_date = df.select(pl.col("date").min()).item() if "date" in df.columns else None
-        max_date = df.select(pl.col("date").max()).item() if "date" in df.columns else None
-        summary["rankings_singles"] = {
-            "count": len(df),
-            "unique_players": df.select(pl.col("player_id").n_unique()).item() if "player_id" in df.columns else 0,
-            "date_range": f"{min_date} to {max_date}" if min_date and max_date else None,
-            "latest_date": max_date,
-            "size": f"{df.estimated_size('mb'):.2f} MB"
+
+# Summary stats from S3 keyed by (filenames, ETags); an ETag only changes when the object does
+SUMMARY_CACHE_SIZE = 8
+_summary_stats: dict[tuple, dict] = {}
+_summary_lock = threading.Lock()
+# Sidecars of a partitioned dataset are fetched in parallel
+SIDECAR_READ_WORKERS = 8
+
+
+def _list_data_files() -> dict[str, tuple[int, str | None]]:
+    """Map every stored parquet filename to (size in bytes, ETag) in one listing."""
+    if USE_S3:
+        assert s3_client is not None
+
+        paginator = s3_client.get_paginator("list_objects_v2")
+        return {
+            obj["Key"].removeprefix(_get_s3_key("")): (obj["Size"], obj["ETag"])
+            for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=_get_s3_key(""))
+            for obj in page.get("Contents", [])
+            if obj["Key"].endswith(".parquet")
         }
-    except FileNotFoundError:
-        summary["rankings_singles"] = None
+    # Local stats are cheap and there is no ETag, so local summaries are never cached
+    return {
+        path.relative_to(LOCAL_DATA_DIR).as_posix(): (path.stat().st_size, None)
+        for path in LOCAL_DATA_DIR.rglob("*.parquet")
+    }
+
+
+def _dataset_files(dataset: str, legacy_filename: str, files: dict) -> list[str]:
+    """Partition filenames of a dataset from the listing, or its legacy single file."""
+    partitions = sorted(name for name in files if name.startswith(f"{dataset}/"))
+    return partitions or [legacy_filename]
+
+
+def _file_size(filenames: list[str], files: dict) -> str:
+    """Stored size of one or more files, from the listing."""
+    total = sum(files[name][0] for name in filenames if name in files)
+    return f"{total / (1024 * 1024):.2f} MB"
+
+
+def _stats_filename(filename: str) -> str:
+    """Sidecar holding the summary stats of a parquet file."""
+    return f"{filename}.stats.json"
+
 
-    # Doubles Rankings
+def _stats_function(filename: str) -> Callable[[pl.LazyFrame, list[str]], dict] | None:
+    """Summary stats function for a data file, or None if it has no sidecar."""
+    # Distinct players don't add up across year partitions, so partitioned
+    # rankings are summarized from a scan instead
+    if filename.endswith("_rankings.parquet") and "/" not in filename:
+        return _rankings_stats
+    if filename == "players.parquet":
+        return _players_stats
+    if filename == "tournaments.parquet" or filename.startswith("tournaments/"):
+        return _tournaments_stats
+    return None
+
+
+def _save_stats(df: pl.DataFrame, filename: str, size: int) -> None:
+    """
+    Write the summary stats sidecar for a just-saved parquet file of `size` bytes.
+
+    The sidecar records which version of the file it describes: the object's
+    ETag on S3, where a same-size rewrite is common for small partitions, and
+    the byte size locally.
+    """
+    compute = _stats_function(filename)
+    if compute is None:
+        return
+
+    if USE_S3:
+        assert s3_client is not None
+        etag = s3_client.head_object(Bucket=BUCKET_NAME, Key=_get_s3_key(filename))["ETag"]
+        version = {"etag": etag}
+    else:
+        version = {"bytes": size}
+
+    # The frame is in memory already, so this costs one pass over it
+    stats = {**version, **compute(df.lazy(), df.columns)}
+    body = json.dumps(stats, default=str)
+
+    if USE_S3:
+        s3_client.put_object(
+            Bucket=BUCKET_NAME,
+            Key=_get_s3_key(_stats_filename(filename)),
+            Body=body,
+            ContentType="application/json"
+        )
+    else:
+        (LOCAL_DATA_DIR / _stats_filename(filename)).write_text(body)
+
+
+def _load_stats(filename: str, size: int, etag: str | None) -> dict | None:
+    """Read a file's stats sidecar; None if missing or written for a different file version."""
     try:
-        df = load_data("doubles_rankings.parquet")
-        min_date = df.select(pl.col("date").min()).item() if "date" in df.columns else None
-        max_date = df.select(pl.col("date").max()).item() if "date" in df.columns else None
-        summary["rankings_doubles"] = {
-            "count": len(df),
-            "unique_players": df.select(pl.col("player_id").n_unique()).item() if "player_id" in df.columns else 0,
-            "date_range": f"{min_date} to {max_date}" if min_date and max_date else None,
-            "latest_date": max_date,
-            "size": f"{df.estimated_size('mb'):.2f} MB"
-        }
-    except FileNotFoundError:
-        summary["rankings_doubles"] = None
+        if USE_S3:
+            assert s3_client is not None
+            response = s3_client.get_object(
+                Bucket=BUCKET_NAME, Key=_get_s3_key(_stats_filename(filename))
+            )
+            stats = json.loads(response["Body"].read())
+        else:
+            stats = json.loads((LOCAL_DATA_DIR / _stats_filename(filename)).read_text())
+    except (FileNotFoundError, ClientError, ValueError):
+        return None
+    # A parquet rewritten without its sidecar would leave stale stats behind
+    recorded_etag, recorded_size = stats.pop("etag", None), stats.pop("bytes", None)
+    stale = recorded_etag != etag if USE_S3 else recorded_size != size
+    if stale:
+        return None
+    return stats
+
+
+def _merge_stats(parts: list[dict]) -> dict:
+    """Combine per-partition tournament stats into dataset totals."""
+    if len(parts) == 1:
+        return parts[0]
+    years = [year for part in parts for year in (part.get("min_year"), part.get("max_year"))]
+    years = [year for year in years if year is not None]
+    return {
+        "count": sum(part["count"] for part in parts),
+        "min_year": min(years, default=None),
+        "max_year": max(years, default=None),
+        "types": sorted({t for part in parts for t in part.get("types", [])}),
+        "with_winners": sum(part.get("with_winners", 0) for part in parts),
+    }
+
+
+def _summarize(
+    filenames: list[str],
+    files: dict[str, tuple[int, str | None]],
+    compute: Callable[[pl.LazyFrame, list[str]], dict]
+) -> dict:
+    """
+    Summary stats of one or more files, reusing the result while their ETags hold.
+
+    Reads the sidecars written by save_data; only when one is missing or stale
+    does it run `compute` on a lazy scan, which reads just the parquet footer
+    and the aggregated columns.
+    """
+    missing = [name for name in filenames if name not in files]
+    if missing:
+        raise FileNotFoundError(", ".join(missing))
+
+    etags = tuple(files[name][1] for name in filenames)
+    key = (tuple(filenames), etags)
+    cacheable = None not in etags
+    if cacheable:
+        with _summary_lock:
+            if key in _summary_stats:
+                return _summary_stats[key]
+
+    if all(_stats_function(name) for name in filenames):
+        with ThreadPoolExecutor(max_workers=SIDECAR_READ_WORKERS) as pool:
+            parts = list(pool.map(lambda name: _load_stats(name, *files[name]), filenames))
+    else:
+        parts = [None]
+    if None in parts:
+        lf = _scan([_scan_source(name) for name in filenames])
+        parts = [compute(lf, lf.collect_schema().names())]
+    stats = _merge_stats(parts)
+
+    if cacheable:
+        with _summary_lock:
+            for stale in [k for k in _summary_stats if k[0] == key[0]]:
+                del _summary_stats[stale]
+            if len(_summary_stats) >= SUMMARY_CACHE_SIZE:
+                del _summary_stats[next(iter(_summary_stats))]
+            _summary_stats[key] = stats
+    return stats
+
+
+def _rankings_stats(lf: pl.LazyFrame, columns: list[str]) -> dict:
+    """Row count, unique players and date range of a rankings file."""
+    exprs = [pl.len().alias("count")]
+    if "player_id" in columns:
+        exprs.append(pl.col("player_id").n_unique().alias("unique_players"))
+    if "date" in columns:
+        exprs += [pl.col("date").min().alias("min_date"), pl.col("date").max().alias("max_date")]
+    row = lf.select(exprs).collect().row(0, named=True)
+
+    min_date, max_date = row.get("min_date"), row.get("max_date")
+    return {
+        "count": row["count"],
+        "unique_players": row.get("unique_players", 0),
+        "date_range": f"{min_date} to {max_date}" if min_date and max_date else None,
+        "latest_date": max_date,
+    }
+
+
+def _players_stats(lf: pl.LazyFrame, columns: list[str]) -> dict:
+    """Row count, bio coverage and country count of the players file."""
+    # Count players with bio data (at least one bio field filled)
+    bio_fields = [
+        field for field in ["birthdate", "weight_kg", "height_cm", "country", "handedness"]
+        if field in columns
+    ]
+    exprs = [pl.len().alias("count")]
+    if bio_fields:
+        exprs.append(
+            pl.any_horizontal([pl.col(field).is_not_null() for field in bio_fields])
+            .sum().alias("with_bio")
+        )
+    # Count unique countries (use "country" column, not "country_code")
+    if "country" in columns:
+        exprs.append(pl.col("country").drop_nulls().n_unique().alias("countries"))
+    row = lf.select(exprs).collect().row(0, named=True)
+
+    with_bio = row.get("with_bio") or 0
+    return {
+        "count": row["count"],
+        "with_bio": int(with_bio),
+        "missing_bio": int(row["count"] - with_bio),
+        "countries": row.get("countries", 0),
+    }
+
+
+def _tournaments_stats(lf: pl.LazyFrame, columns: list[str]) -> dict:
+    """Row count, year range, types and winner coverage of the tournaments files."""
+    exprs = [pl.len().alias("count")]
+    if "year" in columns:
+        exprs += [pl.col("year").min().alias("min_year"), pl.col("year").max().alias("max_year")]
+    if "tournament_type" in columns:
+        exprs.append(pl.col("tournament_type").unique().implode().alias("types"))
+    winner_columns = [c for c in ("singles_winner_id", "doubles_winner_ids") if c in columns]
+    if winner_columns:
+        exprs.append(
+            pl.any_horizontal([pl.col(c).is_not_null() for c in winner_columns])
+            .sum().alias("with_winners")
+        )
+    row = lf.select(exprs).collect().row(0, named=True)
+
+    return {
+        "count": row["count"],
+        "min_year": row.get("min_year"),
+        "max_year": row.get("max_year"),
+        "types": sorted(t for t in row.get("types", []) if t is not None),
+        "with_winners": row.get("with_winners", 0),
+    }
+
+
+def _tournaments_present(stats: dict) -> dict:
+    """Turn merged tournament stats into the summary's year_range form."""
+    min_year, max_year = stats["min_year"], stats["max_year"]
+    return {
+        "count": stats["count"],
+        "year_range": f"{min_year}-{max_year}" if min_year is not None else None,
+        "types": stats["types"],
+        "with_winners": stats["with_winners"],
+    }
 
-    # Players
+
+# Summary key -> (partition directory, legacy single file, stats function, presenter)
+SUMMARY_SPEC: dict[str, tuple[str, str, Callable, Callable[[dict], dict] | None]] = {
+    "rankings_singles": ("singles_rankings", "singles_rankings.parquet", _rankings_stats, None),
+    "rankings_doubles": ("doubles_rankings", "doubles_rankings.parquet", _rankings_stats, None),
+    "players": ("players", "players.parquet", _players_stats, None),
+    "tournaments": ("tournaments", "tournaments.parquet", _tournaments_stats, _tournaments_present),
+}
+
+
+def _dataset_summary(key: str, files: dict) -> dict | None:
+    """Summary entry for one SUMMARY_SPEC dataset; None if it has no data."""
+    dataset, legacy_filename, compute, present = SUMMARY_SPEC[key]
+    filenames = _dataset_files(dataset, legacy_filename, files)
     try:
-        df = load_data("players.parquet")
-
-        # Count players with bio data (at least one bio field filled)
-        bio_fields = ["birthdate", "weight_kg", "height_cm", "country", "handedness"]
-        has_bio = df.select(
-            pl.any_horizontal([pl.col(field).is_not_null() for field in bio_fields if field in df.columns])
-        ).to_series()
-
-        with_bio = has_bio.sum() if len(has_bio) > 0 else 0
-        missing_bio = len(df) - with_bio
-
-        # Count unique countries (use "country" column, not "country_code")
-        countries = 0
-        if "country" in df.columns:
-            countries = df.select(pl.col("country").drop_nulls().n_unique()).item()
-
-        summary["players"] = {
-            "count": len(df),
-            "with_bio": int(with_bio),
-            "missing_bio": int(missing_bio),
-            "countries": countries,
-            "size": f"{df.estimated_size('mb'):.2f} MB"
-        }
+        stats = _summarize(filenames, files, compute)
     except FileNotFoundError:
-        summary["players"] = None
+        return None
     except Exception as e:
-        logger.error(f"Error processing players data: {e}")
-        summary["players"] = {"error": str(e)}
+        logger.error(f"Error processing {key} data: {e}")
+        return {"error": str(e)}
+    return {**(present(stats) if present else stats), "size": _file_size(filenames, files)}
 
-    # Tournaments
-    try:
-        df = load_data("tournaments.parquet")
-
-        year_range = None
-        if "year" in df.columns:
-            min_year = df.select(pl.col("year").min()).item()
-            max_year = df.select(pl.col("year").max()).item()
-            year_range = f"{min_year}-{max_year}"
-
-        tournament_types = []
-        if "tournament_type" in df.columns:
-            tournament_types = df.select(pl.col("tournament_type").unique()).to_series().to_list()
-
-        with_winners = 0
-        if "winner_name" in df.columns:
-            with_winners = df.select(pl.col("winner_name").is_not_null().sum()).item()
-
-        summary["tournaments"] = {
-            "count": len(df),
-            "year_range": year_range,
-            "types": tournament_types,
-            "with_winners": with_winners,
-            "size": f"{df.estimated_size('mb'):.2f} MB"
-        }
-    except FileNotFoundError:
-        summary["tournaments"] = None
 
-    return summary
\ No newline at end of file
+def get_data_summary() -> dict:
+    """
+    Get summary statistics for all data files.
+
+    Stats come from the sidecars save_data writes next to each parquet file,
+    so a summary normally reads a few small JSON objects and no parquet.
+    Datasets are summarized concurrently, so their reads overlap.
+    """
+    summary = {
+        "bucket": BUCKET_NAME if USE_S3 else "local",
+        "storage": "s3" if USE_S3 else "local",
+        "use_s3": USE_S3,
+    }
+    files = _list_data_files()
+
+    with ThreadPoolExecutor(max_workers=len(SUMMARY_SPEC)) as pool:
+        futures = {key: pool.submit(_dataset_summary, key, files) for key in SUMMARY_SPEC}
+    summary.update({key: future.result() for key, future in futures.items()})
+
+    return summary
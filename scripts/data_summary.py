@@ -7,9 +7,30 @@ Prints comprehensive statistics and summaries of all stored data.
 import sys
 sys.path.append('.')
 
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from pathlib import Path
 import polars as pl
-from backend.storage.s3_data_store import DATA_DIR, load_rankings, load_players, load_tournaments
+from backend.storage.s3_data_store import (
+    LOCAL_DATA_DIR as DATA_DIR, USE_S3, scan_rankings, scan_players, scan_tournaments
+)
+
+# Columns each summary reads; projecting them right after the scan keeps the
+# parquet reader from decoding anything else
+RANKINGS_COLUMNS = ['player_id', 'date', 'rank', 'points',
+                    'points_move', 'tournaments_played', 'dropping', 'next_best']
+PLAYERS_COLUMNS = ['birthdate', 'weight_kg', 'height_cm', 'turned_pro',
+                   'country', 'birthplace', 'handedness', 'backhand', 'coach']
+TOURNAMENTS_COLUMNS = ['year', 'tournament_type', 'country_code', 'singles_winner_id',
+                       'singles_winner_name', 'doubles_winner_ids', 'start_date', 'end_date']
+
+def _project(lf: pl.LazyFrame, wanted: list[str]) -> tuple[pl.LazyFrame, list[str]]:
+    """Select the wanted columns that exist in the scan; returns (lf, present columns)."""
+    columns = [col for col in wanted if col in lf.collect_schema().names()]
+    return lf.select(columns), columns
 
 def print_header(title: str):
     """Print a formatted section header."""
@@ -17,214 +38,379 @@ def print_header(title: str):
     print(f"{title:^80}")
     print('=' * 80)
 
+def print_lines(lines):
+    """Print a block of lines with a single write."""
+    lines = list(lines)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+# Table row templates, parsed once and filled from row dicts
+TOP_PLAYER_LINE = "  {i:2d}. Player ID {player_id}: {max_points:,} points".format_map
+TOURNAMENT_COUNTRY_LINE = "  {i:2d}. {country_code:3s}: {count:4,} tournaments".format_map
+TOP_WINNER_LINE = "  {i:2d}. {name:30s}: {wins:3,} titles".format_map
+FILE_LINE = "{name:<34} {rows:>10,} {size:>10} {modified}".format_map
+
 def print_subheader(title: str):
     """Print a formatted subsection header."""
     print(f"\n{'-' * 80}")
     print(f"{title}")
     print('-' * 80)
 
-def summarize_rankings():
-    """Summarize rankings data."""
-    print_header("RANKINGS DATA SUMMARY")
-
-    for ranking_type in ['singles', 'doubles']:
-        try:
-            df = load_rankings(ranking_type)
-
-            print_subheader(f"{ranking_type.upper()} Rankings")
-
-            # Basic stats
-            print(f"Total records: {len(df):,}")
-            print(f"Unique players: {df['player_id'].n_unique():,}")
-            print(f"Unique dates: {df['date'].n_unique():,}")
-
-            # Date range
-            dates = df['date'].sort()
-            print(f"\nDate range:")
-            print(f"  Earliest: {dates.min()}")
-            print(f"  Latest:   {dates.max()}")
-
-            # Rank statistics
-            print(f"\nRank statistics:")
-            print(f"  Min rank: {df['rank'].min()}")
-            print(f"  Max rank: {df['rank'].max()}")
-            print(f"  Average rank: {df['rank'].mean():.1f}")
-
-            # Points statistics
-            print(f"\nPoints statistics:")
-            print(f"  Min points: {df['points'].min():,}")
-            print(f"  Max points: {df['points'].max():,}")
-            print(f"  Average points: {df['points'].mean():.0f}")
-
-            # Top 10 players by max points
-            top_players = (df
-                .group_by('player_id')
-                .agg(pl.col('points').max().alias('max_points'))
-                .sort('max_points', descending=True)
-                .head(10)
-            )
-
-            print(f"\nTop 10 players by max points:")
-            for i, row in enumerate(top_players.iter_rows(named=True), 1):
-                print(f"  {i:2d}. Player ID {row['player_id']}: {row['max_points']:,} points")
-
-            # Data completeness
-            print(f"\nData completeness:")
-            for col in ['points_move', 'tournaments_played', 'dropping', 'next_best']:
-                null_pct = (df[col].null_count() / len(df)) * 100
-                print(f"  {col}: {100 - null_pct:.1f}% complete")
-
-        except FileNotFoundError:
-            print_subheader(f"{ranking_type.upper()} Rankings")
-            print(f"⚠️  No {ranking_type} rankings data found")
+COMPLETENESS_COLUMNS = ['points_move', 'tournaments_played', 'dropping', 'next_best']
+
+def plan_rankings(ranking_type: str) -> dict[str, pl.LazyFrame]:
+    """Queries for one ranking type's summary."""
+    lf = scan_rankings(ranking_type).select(RANKINGS_COLUMNS)
+
+    return {
+        # All scalar stats in one pass
+        'stats': lf.select(
+            pl.len().alias('records'),
+            pl.col('player_id').n_unique().alias('players'),
+            pl.col('date').n_unique().alias('dates'),
+            pl.col('date').min().alias('earliest'),
+            pl.col('date').max().alias('latest'),
+            pl.col('rank').min().alias('min_rank'),
+            pl.col('rank').max().alias('max_rank'),
+            pl.col('rank').mean().alias('mean_rank'),
+            pl.col('points').min().alias('min_points'),
+            pl.col('points').max().alias('max_points'),
+            pl.col('points').mean().alias('mean_points'),
+            *[pl.col(col).null_count().alias(f'{col}_nulls') for col in COMPLETENESS_COLUMNS],
+        ),
+        'top_players': (lf
+            .group_by('player_id')
+            .agg(pl.col('points').max().alias('max_points'))
+            .sort('max_points', descending=True)
+            .head(10)
+        ),
+    }
+
+def print_rankings(ranking_type: str, results: dict[str, pl.DataFrame] | None):
+    """Print one ranking type's summary."""
+    print_subheader(f"{ranking_type.upper()} Rankings")
+    if results is None:
+        print(f"⚠️  No {ranking_type} rankings data found")
+        return
 
-def summarize_players():
-    """Summarize player data."""
+    stats = results['stats'].row(0, named=True)
+
+    # Basic stats
+    print(f"Total records: {stats['records']:,}")
+    print(f"Unique players: {stats['players']:,}")
+    print(f"Unique dates: {stats['dates']:,}")
+
+    # Date range
+    print(f"\nDate range:")
+    print(f"  Earliest: {stats['earliest']}")
+    print(f"  Latest:   {stats['latest']}")
+
+    # Rank statistics
+    print(f"\nRank statistics:")
+    print(f"  Min rank: {stats['min_rank']}")
+    print(f"  Max rank: {stats['max_rank']}")
+    print(f"  Average rank: {stats['mean_rank']:.1f}")
+
+    # Points statistics
+    print(f"\nPoints statistics:")
+    print(f"  Min points: {stats['min_points']:,}")
+    print(f"  Max points: {stats['max_points']:,}")
+    print(f"  Average points: {stats['mean_points']:.0f}")
+
+    # Top 10 players by max points
+    print(f"\nTop 10 players by max points:")
+    print_lines(
+        TOP_PLAYER_LINE({'i': i, **row})
+        for i, row in enumerate(results['top_players'].iter_rows(named=True), 1)
+    )
+
+    # Data completeness
+    print(f"\nData completeness:")
+    for col in COMPLETENESS_COLUMNS:
+        null_pct = (stats[f'{col}_nulls'] / stats['records']) * 100
+        print(f"  {col}: {100 - null_pct:.1f}% complete")
+
+def categorical_counts(lf: pl.LazyFrame, col: str, limit: int | None = None) -> pl.LazyFrame:
+    """Non-null value counts of a column, most frequent first (ties by value)."""
+    counts = (lf
+        .select(col)
+        .filter(pl.col(col).is_not_null())
+        .group_by(col)
+        .agg(pl.len().alias('count'))
+        .sort(['count', col], descending=[True, False])
+    )
+    return counts if limit is None else counts.head(limit)
+
+def plan_players() -> dict[str, pl.LazyFrame]:
+    """Queries for the players summary."""
+    lf, columns = _project(scan_players(), PLAYERS_COLUMNS)
+
+    # All scalar stats in one pass; min/max/mean/median skip nulls
+    scalars = [pl.len().alias('players')]
+    scalars += [pl.col(col).is_not_null().sum().alias(col) for col in PLAYERS_COLUMNS if col in columns]
+    for col in ['height_cm', 'weight_kg']:
+        if col in columns:
+            scalars += [
+                pl.col(col).min().alias(f'{col}_min'),
+                pl.col(col).max().alias(f'{col}_max'),
+                pl.col(col).mean().alias(f'{col}_mean'),
+                pl.col(col).median().alias(f'{col}_median'),
+            ]
+    plans = {'stats': lf.select(scalars)}
+
+    for col, limit in [('country', 10), ('handedness', None), ('backhand', None)]:
+        if col in columns:
+            plans[col] = categorical_counts(lf, col, limit)
+    return plans
+
+def print_players(results: dict[str, pl.DataFrame] | None):
+    """Print the players summary."""
     print_header("PLAYERS DATA SUMMARY")
+    if results is None:
+        print("⚠️  No players data found")
+        return
 
-    try:
-        df = load_players()
-
-        print(f"Total players: {len(df):,}")
-
-        # Bio data completeness
-        bio_cols = ['birthdate', 'weight_kg', 'height_cm', 'turned_pro', 
-                    'country', 'birthplace', 'handedness', 'backhand', 'coach']
-
-        print(f"\nBiographical data completeness:")
-        for col in bio_cols:
-            if col in df.columns:
-                filled = df[col].drop_nulls().len()
-                pct = (filled / len(df)) * 100
-                print(f"  {col:20s}: {filled:5,} / {len(df):5,} ({pct:5.1f}%)")
-            else:
-                print(f"  {col:20s}: Column not found")
-
-        # Country distribution (top 10)
-        if 'country' in df.columns:
-            country_counts = (df
-                .filter(pl.col('country').is_not_null())
-                .group_by('country')
-                .agg(pl.count().alias('count'))
-                .sort('count', descending=True)
-                .head(10)
-            )
+    stats = results['stats'].row(0, named=True)
+    total = stats['players']
 
-            print(f"\nTop 10 countries by player count:")
-            for i, row in enumerate(country_counts.iter_rows(named=True), 1):
-                print(f"  {i:2d}. {row['country']:20s}: {row['count']:4,} players")
-
-        # Handedness distribution
-        if 'handedness' in df.columns:
-            handedness = df.filter(pl.col('handedness').is_not_null())['handedness'].value_counts()
-            print(f"\nHandedness distribution:")
-            for row in handedness.iter_rows(named=True):
-                print(f"  {row['handedness']:15s}: {row['count']:4,} players")
-
-        # Backhand distribution
-        if 'backhand' in df.columns:
-            backhand = df.filter(pl.col('backhand').is_not_null())['backhand'].value_counts()
-            print(f"\nBackhand distribution:")
-            for row in backhand.iter_rows(named=True):
-                print(f"  {row['backhand']:20s}: {row['count']:4,} players")
-
-        # Height statistics
-        if 'height_cm' in df.columns:
-            heights = df.filter(pl.col('height_cm').is_not_null())['height_cm']
-            if len(heights) > 0:
-                print(f"\nHeight statistics (cm):")
-                print(f"  Min:     {heights.min()}")
-                print(f"  Max:     {heights.max()}")
-                print(f"  Average: {heights.mean():.1f}")
-                print(f"  Median:  {heights.median():.1f}")
-
-        # Weight statistics
-        if 'weight_kg' in df.columns:
-            weights = df.filter(pl.col('weight_kg').is_not_null())['weight_kg']
-            if len(weights) > 0:
-                print(f"\nWeight statistics (kg):")
-                print(f"  Min:     {weights.min()}")
-                print(f"  Max:     {weights.max()}")
-                print(f"  Average: {weights.mean():.1f}")
-                print(f"  Median:  {weights.median():.1f}")
+    print(f"Total players: {total:,}")
 
-    except FileNotFoundError:
-        print("⚠️  No players data found")
-
-def summarize_tournaments():
-    """Summarize tournament data."""
-    print_header("TOURNAMENTS DATA SUMMARY")
+    print(f"\nBiographical data completeness:")
+    for col in PLAYERS_COLUMNS:
+        if col in stats:
+            filled = stats[col]
+            pct = (filled / total) * 100
+            print(f"  {col:20s}: {filled:5,} / {total:5,} ({pct:5.1f}%)")
+        else:
+            print(f"  {col:20s}: Column not found")
 
-    try:
-        df = load_tournaments()
-
-        print(f"Total tournaments: {len(df):,}")
-
-        # Year range
-        print(f"\nYear range:")
-        print(f"  Earliest: {df['year'].min()}")
-        print(f"  Latest:   {df['year'].max()}")
-
-        # Tournament types
-        type_counts = df['tournament_type'].value_counts().sort('tournament_type')
-        print(f"\nTournament types:")
-        for row in type_counts.iter_rows(named=True):
-            print(f"  {row['tournament_type']:10s}: {row['count']:4,} tournaments")
-
-        # Tournaments by year (last 5 years)
-        recent_years = sorted(df['year'].unique())[-5:]
-        print(f"\nTournaments per year (recent):")
-        for year in recent_years:
-            count = df.filter(pl.col('year') == year).height
-            print(f"  {year}: {count:3,} tournaments")
-
-        # Country distribution (top 10)
-        if 'country_code' in df.columns:
-            country_counts = (df
-                .filter(pl.col('country_code').is_not_null())
-                .group_by('country_code')
-                .agg(pl.count().alias('count'))
-                .sort('count', descending=True)
-                .head(10)
+    # Country distribution (top 10)
+    if 'country' in results:
+        print(f"\nTop 10 countries by player count:")
+        if stats['country'] == 0:
+            print("  (no country data)")
+        else:
+            print_lines(
+                f"  {i:2d}. {row['country']:20s}: {row['count']:4,} players"
+                for i, row in enumerate(results['country'].iter_rows(named=True), 1)
             )
 
-            print(f"\nTop 10 countries by tournament count:")
-            for i, row in enumerate(country_counts.iter_rows(named=True), 1):
-                print(f"  {i:2d}. {row['country_code']:3s}: {row['count']:4,} tournaments")
-
-        # Singles vs doubles winners
-        singles_count = df.filter(pl.col('singles_winner_id').is_not_null()).height
-        doubles_count = df.filter(pl.col('doubles_winner_ids').is_not_null()).height
-
-        print(f"\nWinner data:")
-        print(f"  Tournaments with singles winner: {singles_count:,} ({singles_count/len(df)*100:.1f}%)")
-        print(f"  Tournaments with doubles winners: {doubles_count:,} ({doubles_count/len(df)*100:.1f}%)")
-
-        # Most frequent winners (singles, top 10)
-        if singles_count > 0:
-            top_winners = (df
-                .filter(pl.col('singles_winner_id').is_not_null())
-                .group_by(['singles_winner_id', 'singles_winner_name'])
-                .agg(pl.count().alias('wins'))
-                .sort('wins', descending=True)
-                .head(10)
+    # Handedness distribution
+    if 'handedness' in results:
+        print(f"\nHandedness distribution:")
+        if stats['handedness'] == 0:
+            print("  (no handedness data)")
+        else:
+            print_lines(
+                f"  {row['handedness']:15s}: {row['count']:4,} players"
+                for row in results['handedness'].iter_rows(named=True)
             )
 
-            print(f"\nTop 10 singles winners:")
-            for i, row in enumerate(top_winners.iter_rows(named=True), 1):
-                name = row['singles_winner_name'] or f"ID: {row['singles_winner_id']}"
-                print(f"  {i:2d}. {name:30s}: {row['wins']:3,} titles")
-
-        # Date completeness
-        start_date_pct = (df['start_date'].drop_nulls().len() / len(df)) * 100
-        end_date_pct = (df['end_date'].drop_nulls().len() / len(df)) * 100
+    # Backhand distribution
+    if 'backhand' in results:
+        print(f"\nBackhand distribution:")
+        if stats['backhand'] == 0:
+            print("  (no backhand data)")
+        else:
+            print_lines(
+                f"  {row['backhand']:20s}: {row['count']:4,} players"
+                for row in results['backhand'].iter_rows(named=True)
+            )
 
-        print(f"\nDate data completeness:")
-        print(f"  Start dates: {start_date_pct:.1f}%")
-        print(f"  End dates:   {end_date_pct:.1f}%")
+    # Height and weight statistics
+    for col, label in [('height_cm', 'Height statistics (cm)'), ('weight_kg', 'Weight statistics (kg)')]:
+        if f'{col}_min' in stats and stats[col] > 0:
+            print(f"\n{label}:")
+            print(f"  Min:     {stats[f'{col}_min']}")
+            print(f"  Max:     {stats[f'{col}_max']}")
+            print(f"  Average: {stats[f'{col}_mean']:.1f}")
+            print(f"  Median:  {stats[f'{col}_median']:.1f}")
+
+def plan_tournaments() -> dict[str, pl.LazyFrame]:
+    """Queries for the tournaments summary."""
+    lf, columns = _project(scan_tournaments(), TOURNAMENTS_COLUMNS)
+
+    plans = {
+        # Scalars and completeness counts in one pass
+        'stats': lf.select(
+            pl.len().alias('tournaments'),
+            pl.col('year').min().alias('earliest'),
+            pl.col('year').max().alias('latest'),
+            pl.col('singles_winner_id').is_not_null().sum().alias('singles'),
+            pl.col('doubles_winner_ids').is_not_null().sum().alias('doubles'),
+            pl.col('start_date').is_not_null().sum().alias('start_dates'),
+            pl.col('end_date').is_not_null().sum().alias('end_dates'),
+        ),
+        'types': lf.group_by('tournament_type').agg(pl.len().alias('count')).sort('tournament_type'),
+        'per_year': (lf
+            .group_by('year')
+            .agg(pl.len().alias('count'))
+            .sort('year', descending=True)
+            .head(5)
+        ),
+        'top_winners': (lf
+            .filter(pl.col('singles_winner_id').is_not_null())
+            .group_by(['singles_winner_id', 'singles_winner_name'])
+            .agg(pl.len().alias('wins'))
+            .sort('wins', descending=True)
+            .head(10)
+        ),
+    }
+    if 'country_code' in columns:
+        plans['country'] = (lf
+            .filter(pl.col('country_code').is_not_null())
+            .group_by('country_code')
+            .agg(pl.len().alias('count'))
+            .sort('count', descending=True)
+            .head(10)
+        )
+    return plans
+
+def print_tournaments(results: dict[str, pl.DataFrame] | None):
+    """Print the tournaments summary."""
+    print_header("TOURNAMENTS DATA SUMMARY")
+    if results is None:
+        print("⚠️  No tournaments data found")
+        return
 
+    stats = results['stats'].row(0, named=True)
+    total = stats['tournaments']
+
+    print(f"Total tournaments: {total:,}")
+
+    # Year range
+    print(f"\nYear range:")
+    print(f"  Earliest: {stats['earliest']}")
+    print(f"  Latest:   {stats['latest']}")
+
+    # Tournament types
+    print(f"\nTournament types:")
+    print_lines(
+        f"  {row['tournament_type']:10s}: {row['count']:4,} tournaments"
+        for row in results['types'].iter_rows(named=True)
+    )
+
+    # Tournaments by year (last 5 years)
+    print(f"\nTournaments per year (recent):")
+    print_lines(
+        f"  {row['year']}: {row['count']:3,} tournaments"
+        for row in results['per_year'].reverse().iter_rows(named=True)
+    )
+
+    # Country distribution (top 10)
+    if 'country' in results:
+        print(f"\nTop 10 countries by tournament count:")
+        print_lines(
+            TOURNAMENT_COUNTRY_LINE({'i': i, **row})
+            for i, row in enumerate(results['country'].iter_rows(named=True), 1)
+        )
+
+    # Singles vs doubles winners
+    singles_count = stats['singles']
+    doubles_count = stats['doubles']
+
+    print(f"\nWinner data:")
+    print(f"  Tournaments with singles winner: {singles_count:,} ({singles_count/total*100:.1f}%)")
+    print(f"  Tournaments with doubles winners: {doubles_count:,} ({doubles_count/total*100:.1f}%)")
+
+    # Most frequent winners (singles, top 10)
+    if singles_count > 0:
+        print(f"\nTop 10 singles winners:")
+        print_lines(
+            TOP_WINNER_LINE({
+                'i': i, 'wins': row['wins'],
+                'name': row['singles_winner_name'] or f"ID: {row['singles_winner_id']}",
+            })
+            for i, row in enumerate(results['top_winners'].iter_rows(named=True), 1)
+        )
+
+    # Date completeness
+    start_date_pct = (stats['start_dates'] / total) * 100
+    end_date_pct = (stats['end_dates'] / total) * 100
+
+    print(f"\nDate data completeness:")
+    print(f"  Start dates: {start_date_pct:.1f}%")
+    print(f"  End dates:   {end_date_pct:.1f}%")
+
+def collect_plans(plans: dict[str, dict[str, pl.LazyFrame] | None]) -> dict[str, dict[str, pl.DataFrame] | None]:
+    """Run every summary's queries in one collect_all so the planner can share work across them."""
+    keys = [(name, key) for name, queries in plans.items() if queries for key in queries]
+    # Every query is an aggregation, so the streaming engine never holds whole columns
+    frames = pl.collect_all([plans[name][key] for name, key in keys], engine='streaming')
+
+    results: dict[str, dict[str, pl.DataFrame] | None] = {name: None for name in plans}
+    for (name, key), frame in zip(keys, frames):
+        results[name] = {**(results[name] or {}), key: frame}
+    return results
+
+def _plan_or_none(plan, *args) -> dict[str, pl.LazyFrame] | None:
+    """Build a summary's queries, or None if its data does not exist."""
+    try:
+        return plan(*args)
     except FileNotFoundError:
-        print("⚠️  No tournaments data found")
+        return None
+
+# Summary name -> dataset stem under DATA_DIR ({stem}.parquet and/or {stem}/*.parquet)
+SUMMARY_SOURCES = {
+    'singles': 'singles_rankings',
+    'doubles': 'doubles_rankings',
+    'players': 'players',
+    'tournaments': 'tournaments',
+}
+SUMMARY_PLANS = {
+    'singles': partial(plan_rankings, 'singles'),
+    'doubles': partial(plan_rankings, 'doubles'),
+    'players': plan_players,
+    'tournaments': plan_tournaments,
+}
+# Computed summary frames, reused while their source files are unchanged
+CACHE_DIR = DATA_DIR / '.summary_cache'
+# Bump whenever a plan_* function changes the frames or columns it produces,
+# so caches written for the old shape are recomputed instead of misread
+CACHE_VERSION = 1
+
+def _fingerprint(name: str) -> list | None:
+    """(path, mtime, size) of a summary's local source files; None if there are none."""
+    if USE_S3:
+        return None
+    stem = SUMMARY_SOURCES[name]
+    paths = [DATA_DIR / f'{stem}.parquet', *sorted((DATA_DIR / stem).glob('*.parquet'))]
+    entries = []
+    for path in paths:
+        if path.exists():
+            st = path.stat()
+            entries.append([path.relative_to(DATA_DIR).as_posix(), st.st_mtime_ns, st.st_size])
+    return entries or None
+
+def _load_cached(name: str, fingerprint: list) -> dict[str, pl.DataFrame] | None:
+    """Cached frames of a summary, if computed from the same source files."""
+    try:
+        meta = json.loads((CACHE_DIR / name / 'meta.json').read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    if meta.get('version') != CACHE_VERSION or meta.get('fingerprint') != fingerprint:
+        return None
+    return {key: pl.read_parquet(CACHE_DIR / name / f'{key}.parquet') for key in meta['frames']}
+
+def _store_cached(name: str, fingerprint: list, frames: dict[str, pl.DataFrame]):
+    """Save a summary's frames; meta.json is written last so a partial write never matches."""
+    cache_dir = CACHE_DIR / name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for key, frame in frames.items():
+        frame.write_parquet(cache_dir / f'{key}.parquet')
+    (cache_dir / 'meta.json').write_text(json.dumps({
+        'version': CACHE_VERSION, 'fingerprint': fingerprint, 'frames': list(frames)
+    }))
+
+def _format_size(size: int) -> str:
+    """Human-readable file size."""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 ** 2:
+        return f"{size / 1024:.1f} KB"
+    if size < 1024 ** 3:
+        return f"{size / (1024 ** 2):.1f} MB"
+    return f"{size / (1024 ** 3):.1f} GB"
 
 def summarize_files():
     """Summarize data files."""
@@ -236,32 +422,42 @@ def summarize_files():
         print("⚠️  Data directory does not exist")
         return
 
-    files = sorted(DATA_DIR.glob("*.parquet"))
+    # (name, stat) of top-level files and year partitions; DirEntry.stat() is
+    # a single cached syscall
+    files = []
+    with os.scandir(DATA_DIR) as entries:
+        for entry in entries:
+            if entry.name.endswith('.parquet') and entry.is_file():
+                files.append((entry.name, entry.stat()))
+            elif entry.is_dir() and not entry.name.startswith('.'):
+                with os.scandir(entry.path) as parts:
+                    files += [
+                        (f"{entry.name}/{part.name}", part.stat())
+                        for part in parts if part.name.endswith('.parquet') and part.is_file()
+                    ]
+    files.sort()
 
     if not files:
         print("⚠️  No data files found")
         return
 
-    print(f"{'File':<30} {'Size':>15} {'Modified'}")
-    print('-' * 80)
+    # Row counts come from each file's footer metadata; no data pages are read
+    row_counts = pl.collect_all([
+        pl.scan_parquet(DATA_DIR / name).select(pl.len()) for name, _ in files
+    ])
 
-    for file in files:
-        size = file.stat().st_size
-        modified = file.stat().st_mtime
-        from datetime import datetime
-        mod_date = datetime.fromtimestamp(modified).strftime('%Y-%m-%d %H:%M:%S')
-
-        # Format size
-        if size < 1024:
-            size_str = f"{size} B"
-        elif size < 1024 ** 2:
-            size_str = f"{size / 1024:.1f} KB"
-        elif size < 1024 ** 3:
-            size_str = f"{size / (1024 ** 2):.1f} MB"
-        else:
-            size_str = f"{size / (1024 ** 3):.1f} GB"
+    print(f"{'File':<34} {'Rows':>10} {'Size':>10} {'Modified'}")
+    print('-' * 80)
 
-        print(f"{file.name:<30} {size_str:>15} {mod_date}")
+    print_lines(
+        FILE_LINE({
+            'name': name,
+            'rows': rows.item(),
+            'size': _format_size(st.st_size),
+            'modified': datetime.fromtimestamp(st.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
+        })
+        for (name, st), rows in zip(files, row_counts)
+    )
 
 def main():
     """Run all summaries."""
@@ -271,10 +467,33 @@ def main():
     print("█" + " " * 78 + "█")
     print("█" * 80)
 
-    summarize_files()
-    summarize_rankings()
-    summarize_players()
-    summarize_tournaments()
+    # Only summaries whose source files changed since the last run are recomputed
+    fingerprints = {name: _fingerprint(name) for name in SUMMARY_PLANS}
+    results = {
+        name: _load_cached(name, fingerprint) if fingerprint else None
+        for name, fingerprint in fingerprints.items()
+    }
+    stale = [name for name, frames in results.items() if frames is None]
+
+    # The summary queries run in the background (Polars releases the GIL)
+    # while the file listing is gathered and printed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(
+            collect_plans, {name: _plan_or_none(SUMMARY_PLANS[name]) for name in stale}
+        )
+        summarize_files()
+        computed = pending.result()
+
+    for name, frames in computed.items():
+        if frames is not None and fingerprints[name]:
+            _store_cached(name, fingerprints[name], frames)
+    results.update(computed)
+
+    print_header("RANKINGS DATA SUMMARY")
+    print_rankings('singles', results['singles'])
+    print_rankings('doubles', results['doubles'])
+    print_players(results['players'])
+    print_tournaments(results['tournaments'])
 
     print("\n" + "=" * 80)
     print("Summary complete!")
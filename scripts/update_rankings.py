@@ -6,8 +6,6 @@ import logging
 
 sys.path.append('.')
 
-from backend.scraper.updater import update_rankings
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +28,9 @@ def main():
         print("Error: RANKING_TYPE must be 'singles' or 'doubles'")
         sys.exit(1)
 
+    # The updater pulls in Polars and Playwright; only load it once the arguments check out
+    from backend.scraper.updater import update_rankings
+
     scraped = update_rankings(ranking_type, max_weeks)
     print(f"\nCompleted: Scraped {scraped} weeks of {ranking_type} rankings")
 
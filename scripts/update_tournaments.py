@@ -6,11 +6,7 @@ import logging
 
 sys.path.append('.')
 
-from backend.scraper.tournament_scraper import scrape_tournaments
 from backend.scraper.config import VALID_TOURNAMENT_TYPES
-from backend.scraper.schemas import TOURNAMENTS_SCHEMA
-from backend.storage.s3_data_store import load_tournaments, save_tournaments, upsert_data
-import polars as pl
 
 # Configure logging
 logging.basicConfig(
@@ -40,32 +36,32 @@ def main():
         print(f"Valid types are: {', '.join(VALID_TOURNAMENT_TYPES)}")
         sys.exit(1)
 
-    # Scrape tournaments
-    new_tournaments = []
-    for year in range(start_year, end_year + 1):
-        for t_type in types:
-            logger.info(f"Scraping {t_type} {year}...")
-            new_tournaments.append(scrape_tournaments(year, t_type))
+    # Polars, Playwright and the S3 client are only loaded once the arguments check out
+    from backend.scraper.tournament_scraper import scrape_tournaments_batch
+    from backend.scraper.http_utils import playwright_session
+    from backend.storage.s3_data_store import upsert_tournaments, scan_tournaments
+    import polars as pl
+
+    # Scrape tournaments in a single browser session
+    with playwright_session() as ctx:
+        jobs = [(year, t_type) for year in range(start_year, end_year + 1) for t_type in types]
+        new_tournaments = [df for _, _, df in scrape_tournaments_batch(jobs, context=ctx)]
 
     if not new_tournaments:
         logger.warning("No tournaments scraped")
         return
 
-    new_df = pl.concat(new_tournaments)
-
-    # Load existing and merge
-    existing_df = load_tournaments(schema=TOURNAMENTS_SCHEMA)
+    # Every scraped frame (even an empty one) is built with TOURNAMENTS_SCHEMA, so
+    # the strict vertical concat needs no dtype unification. No rechunk either:
+    # upsert_tournaments splits the rows by year straight away
+    new_df = pl.concat(new_tournaments, rechunk=False)
 
-    # Deduplicate by (year, type, name, start_date)
-    combined_df = upsert_data(
-        new_df,
-        existing_df,
-        ['year', 'tournament_type', 'tournament_name', 'start_date']
-    )
+    # Merge into the affected year partitions, deduplicating by (year, type, name, start_date)
+    upsert_tournaments(new_df)
 
-    save_tournaments(combined_df)
-    logger.info(f"Scraped {len(new_df)} tournaments, total: {len(combined_df)}")
-    print(f"\nCompleted: {len(new_df)} new tournaments, {len(combined_df)} total")
+    total = scan_tournaments().select(pl.len()).collect().item()
+    logger.info(f"Scraped {len(new_df)} tournaments, total: {total}")
+    print(f"\nCompleted: {len(new_df)} new tournaments, {total} total")
 
 
 if __name__ == "__main__":
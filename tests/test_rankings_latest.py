@@ -0,0 +1,41 @@
+"""Regression tests for /rankings/stored latest_only selection."""
+
+import unittest
+
+import polars as pl
+
+from backend.api.main import _query_rankings
+from backend.scraper.schemas import RANKINGS_SCHEMA
+
+
+def _row(**values) -> dict:
+    return {col: values.get(col) for col in RANKINGS_SCHEMA}
+
+
+class LatestOnlyTest(unittest.TestCase):
+    def test_null_player_id_row_does_not_top_leaderboard(self):
+        df = pl.DataFrame([
+            _row(rank=2, player_id="a0e2", date="2024-01-01", type="singles"),
+            _row(rank=1, player_id="a0e2", date="2024-01-08", type="singles"),
+            _row(rank=3, player_id="s0ag", date="2024-01-08", type="singles"),
+            _row(rank=57, player_id=None, date="2024-01-08", type="singles"),
+        ], schema=RANKINGS_SCHEMA)
+
+        result = _query_rankings(df, None, limit=10, latest_only=True)
+
+        self.assertEqual(result["rank"].to_list(), [1, 3, 57])
+        self.assertEqual(result["player_id"].to_list(), ["a0e2", "s0ag", None])
+        self.assertEqual(result["date"].null_count(), 0)
+
+    def test_undated_rows_keep_their_rank(self):
+        df = pl.DataFrame([
+            _row(rank=5, player_id="d643", date=None, type="singles"),
+        ], schema=RANKINGS_SCHEMA)
+
+        result = _query_rankings(df, None, limit=10, latest_only=True)
+
+        self.assertEqual(result["rank"].to_list(), [5])
+
+
+if __name__ == "__main__":
+    unittest.main()